@@ -24,9 +24,11 @@ else:
     from . import clone_tools_ops
     from . import clone_tools_ui
 
-import bpy, os, csv
+import bpy
 from pathlib import Path
 
+HERE = Path(__file__).resolve().parent
+
 def register():
     import bpy.utils.previews
 
@@ -39,20 +41,14 @@ def register():
     preview_collections = {}
 
     pcoll = bpy.utils.previews.new()
-    icons_dir = os.path.join(os.path.dirname(__file__), "icons")
-    pcoll.load('rtfkt_logo', os.path.abspath(os.path.join(icons_dir, 'rtfkt_logo_white_32x32.png')), 'IMAGE')
+    icon_path = HERE / 'icons' / 'rtfkt_logo_white_32x32.png'
+    pcoll.load('rtfkt_logo', str(icon_path), 'IMAGE')
     preview_collections["main"] = pcoll
 
     bpy.types.WindowManager.preview_collections = preview_collections
 
-    trait_catalog_dict = {}
-    mapping_file_path = os.path.join(Path(__file__).resolve().parent, 'assets', 'catalog_trait_mapping.csv')
-
-    with open(mapping_file_path, 'r') as data:
-        for row in csv.DictReader(data, fieldnames=('trait_name','catalog_id')):
-            trait_catalog_dict[row['trait_name'].lower()] = row['catalog_id']
-
-    bpy.types.WindowManager.TRAIT_MAPPING = trait_catalog_dict
+    # Trait catalog CSV is parsed lazily by clone_tools_utils.get_trait_mapping()
+    bpy.types.WindowManager.TRAIT_MAPPING = None
 
     addon_updater_ops.register(bl_info)    
     clone_tools_props.register()
@@ -1,4 +1,4 @@
-import bpy
+import bpy, re, sys
 
 # Define the search strings and their replacements
 search_replacements = {
@@ -57,34 +57,82 @@ search_replacements = {
     # Add more entries as needed
 }
 
-try:
-    # Iterate through all objects in the scene
-    for obj in bpy.data.objects:
-        # Check if the object has a shape key collection
-        if obj.type == "MESH" and obj.data.shape_keys:
-            shape_keys = obj.data.shape_keys.key_blocks
+# Frozen (lowercase search, replacement) pairs. Keys are authored lowercase,
+# so nothing needs case-folding here at runtime.
+_RENAMES = tuple(search_replacements.items())
 
+# Compile the table once at import into a single alternation so each shape
+# key name is scanned in one pass instead of once per entry.
+_PATTERN = re.compile("|".join(re.escape(search) for search, _ in _RENAMES))
+_LOOKUP = dict(_RENAMES)
+# Target names; keys already carrying one of these need no work at all
+_CANONICAL = frozenset(replacement for _, replacement in _RENAMES)
+
+def rename_all_shape_keys(context=None):
+    """
+    Rename ARKit-style shape keys on every mesh to their canonical names.
+    Returns the list of (object name, old name, new name) renames.
+    """
+    context = context if context is not None else bpy.context
+    modified = []
+    # (key block, new name) pairs, collected first and written in one batch
+    pending = []
+
+    try:
+        # Only meshes with shape keys matter; fetch their key_blocks once up front
+        mesh_shape_objs = [
+            (obj, obj.data.shape_keys.key_blocks)
+            for obj in bpy.data.objects
+            if obj.type == "MESH" and obj.data.shape_keys
+        ]
+
+        for obj, shape_keys in mesh_shape_objs:
             # Iterate through the shape keys
             for shape_key in shape_keys:
-                # Iterate through the search strings and replacements
-                for search_string, replacement in search_replacements.items():
-                    # Perform a case-insensitive search and replace
-                    if search_string.lower() in shape_key.name.lower():
-                        shape_key.name = replacement
+                old_name = shape_key.name
+                # Already renamed on a previous run: single hash lookup, no case-folding
+                if old_name in _CANONICAL:
+                    continue
 
-    # Update the scene to reflect the changes
-    bpy.context.view_layer.update()
+                # Most keys are the bare name in another case, so try an exact
+                # lookup first. Otherwise fall back to the substring search;
+                # a hit renames the whole key, matching the previous
+                # per-entry behaviour.
+                lower_name = old_name.lower()
+                new_name = _LOOKUP.get(lower_name)
+                if new_name is None:
+                    match = _PATTERN.search(lower_name)
+                    if match is None:
+                        continue
 
-    # Print the modified shape key names
-    print("Modified Shape Key Names:")
-    for obj in bpy.context.scene.objects:
-        if obj.type == "MESH" and obj.data.shape_keys:
-            shape_keys = obj.data.shape_keys.key_blocks
-            for shape_key in shape_keys:
-                print(shape_key.name)
+                    new_name = _LOOKUP[match.group(0)]
+                # Only queue real changes to avoid needless RNA updates
+                if new_name != old_name:
+                    pending.append((shape_key, new_name))
+                    modified.append((obj.name, old_name, new_name))
+
+        # Apply every rename in one batch once the scan is done
+        for shape_key, new_name in pending:
+            shape_key.name = new_name
+
+        # Name-only edits need no depsgraph evaluation; just ask the UI to redraw
+        screen = context.screen
+        if modified and screen is not None:
+            for area in screen.areas:
+                area.tag_redraw()
+
+        # Print the modified shape key names from the first pass instead of
+        # walking every object's shape keys a second time, as one write
+        out = ["Modified Shape Key Names:"]
+        out.extend(f"{obj_name}: {old_name} -> {new_name}" for obj_name, old_name, new_name in modified)
+        out.append("Script execution completed.")
+        sys.stdout.write("\n".join(out) + "\n")
+
+    except Exception as e:
+        print("An error occurred during script execution:")
+        print(str(e))
 
-    print("Script execution completed.")
+    return modified
 
-except Exception as e:
-    print("An error occurred during script execution:")
-    print(str(e))
\ No newline at end of file
+if __name__ == "__main__":
+    rename_all_shape_keys()
@@ -3,40 +3,59 @@ from pathlib import Path
 
 def get_context_asset(context):
     """Return the active asset from context in Blender 5.0+."""
-    return getattr(context, "asset", None)
+    try:
+        return context.asset
+    except AttributeError:
+        return None
 
 def get_asset_name(asset):
-    return getattr(asset, "name", "")
+    try:
+        return asset.name
+    except AttributeError:
+        return ""
 
 
 def get_asset_id_type(asset):
-    return getattr(asset, "id_type", None)
+    try:
+        return asset.id_type
+    except AttributeError:
+        return None
 
 
 def is_local_asset(asset):
-    local_id = getattr(asset, "local_id", None)
-    return local_id is not None
-
-
-def get_asset_full_library_path(context, asset=None):
-    """Resolve full .blend path for an external asset in Blender 5.0+."""
+    try:
+        return asset.local_id is not None
+    except AttributeError:
+        return False
+
+
+def get_asset_full_library_path(context, asset=None, as_path=False):
+    """
+    Resolve full .blend path for an external asset in Blender 5.0+.
+    Returns the raw path string, or a Path when `as_path` is set.
+    Callers should resolve the asset once and pass it in; the context
+    lookup when `asset` is None is deprecated and kept for old callers.
+    """
     asset = asset or get_context_asset(context)
     if asset is None:
         return None
 
-    full_library_path = getattr(asset, "full_library_path", None)
-    if full_library_path:
-        return Path(full_library_path)
+    try:
+        full_library_path = asset.full_library_path
+    except AttributeError:
+        return None
+
+    if not full_library_path:
+        return None
 
-    return None
+    return Path(full_library_path) if as_path else full_library_path
 
 
 def set_space_asset_library(space, library_name):
     """Set an Asset Browser space library field in Blender 5.0+."""
-    if hasattr(space, "asset_library_reference"):
-        try:
-            setattr(space, "asset_library_reference", library_name)
-            return True
-        except Exception:
-            return False
-    return False
+    # Missing attribute (non-asset space) and invalid enum values both land here
+    try:
+        space.asset_library_reference = library_name
+        return True
+    except Exception:
+        return False
@@ -1,13 +1,18 @@
-import bpy, addon_utils, os, zipfile, webbrowser, shutil, json, time, csv, tempfile, uuid, hashlib, math
+import bpy, addon_utils, os, io, errno, re, zipfile, webbrowser, shutil, sys, json, time, csv, tempfile, uuid, hashlib, math, logging, subprocess
 import mathutils
+import numpy as np
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from bpy.types import Operator, Action, Object, FCurve, UIList, Context
 from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 from bpy_extras.io_utils import ImportHelper
 
 from . import clone_tools_utils as ctutils
+from .clone_tools_props import bulk_add_shots
 from .clone_tools_compat import (
     get_asset_full_library_path,
     get_asset_id_type,
@@ -18,8 +23,45 @@ from .clone_tools_compat import (
 from .lib.easybpy import *
 from . import blendshape_renamer
 
+# Pack discovery and extraction diagnostics. Progress is logged at INFO and
+# per-file details at DEBUG, so nothing is formatted unless a handler asks
+# for it (e.g. logging.basicConfig(level=logging.INFO)).
+log = logging.getLogger("clonex")
+
+# Optional: libarchive-c streams zip members through its C reader, which is
+# faster than zipfile for packs with thousands of small textures.
+try:
+    import libarchive as _libarchive
+except ImportError:
+    _libarchive = None
+
+# Windows only: create directory junctions without spawning cmd.exe mklink
+try:
+    from _winapi import CreateJunction as _create_junction
+except ImportError:
+    _create_junction = None
+
+# Optional: Pillow decodes character sheet shots off the main thread.
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+# Optional: libvips joins grid contact sheets without decoding whole shots
+# into Python memory.
+try:
+    import pyvips as _pyvips
+except ImportError:
+    _pyvips = None
+
 # === Windows Long Path Support Functions ===
 
+@lru_cache(maxsize=1024)
+def _short_hash(value: str, length: int) -> str:
+    """Deterministic short hex id for `value`, used to build short folder names."""
+    # Not security sensitive; blake2b with a tiny digest is cheaper than md5
+    return hashlib.blake2b(value.encode(), digest_size=(length + 1) // 2).hexdigest()[:length]
+
 def get_short_path_name(long_path):
     """
     Get Windows short path name (8.3 format) to work around MAX_PATH limitations.
@@ -52,8 +94,7 @@ def create_safe_temp_dir(base_name="clonex_extract"):
     temp_base = tempfile.gettempdir()
     
     # Create very short unique identifier using hash
-    hash_obj = hashlib.md5(base_name.encode())
-    short_id = hash_obj.hexdigest()[:4]  # Reduced from 8 to 4 characters
+    short_id = _short_hash(base_name, 4)  # Reduced from 8 to 4 characters
     
     # Create temp directory with very short name
     temp_dir = os.path.join(temp_base, f"c{short_id}")  # Even shorter prefix
@@ -76,7 +117,107 @@ def create_safe_temp_dir(base_name="clonex_extract"):
             os.makedirs(final_dir, exist_ok=True)
             return final_dir
 
-def safe_extractall(zip_ref, extract_path, max_path_length=200):
+def _to_long_path(path):
+    """Prefix an absolute Windows path with \\\\?\\ so it may exceed MAX_PATH."""
+    abs_path = os.path.abspath(path)
+    if abs_path.startswith("\\\\"):
+        # Already prefixed, or a UNC share (which needs the \\\\?\\UNC\\ form)
+        if abs_path.startswith("\\\\?\\"):
+            return abs_path
+        return "\\\\?\\UNC\\" + abs_path[2:]
+    return "\\\\?\\" + abs_path
+
+# Buffer used when streaming zip members to disk
+_COPY_BUFSZ = 1 << 20
+_posix_fallocate = getattr(os, 'posix_fallocate', None)
+
+_WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', '_______')
+
+def _member_target_parts(filename):
+    """Split a zip member name into safe path components, like ZipFile.extract."""
+    raw_parts = filename.replace("\\", "/").split("/")
+    # Drop a leading drive letter ("C:") the same way zipfile does
+    if os.name == 'nt' and raw_parts and len(raw_parts[0]) == 2 and raw_parts[0][1] == ":":
+        raw_parts = raw_parts[1:]
+
+    parts = []
+    for part in raw_parts:
+        if part in ("", ".", ".."):
+            continue
+        if os.name == 'nt':
+            part = part.translate(_WINDOWS_ILLEGAL_CHARS).rstrip(".")
+            if not part:
+                continue
+        parts.append(part)
+    return parts
+
+def _extract_members_direct(zip_ref, dest_root):
+    """
+    Stream every member straight to `dest_root` in a single write pass.
+    All destination directories are created up front.
+    """
+    targets = []
+    dirs = {dest_root}
+    for member in zip_ref.infolist():
+        parts = _member_target_parts(member.filename)
+        if not parts:
+            continue
+        target = os.path.join(dest_root, *parts)
+        if member.is_dir():
+            dirs.add(target)
+        else:
+            dirs.add(os.path.dirname(target))
+            targets.append((member, target))
+
+    for dir_path in sorted(dirs, key=len):
+        os.makedirs(dir_path, exist_ok=True)
+
+    for member, target in targets:
+        with zip_ref.open(member) as src, open(target, 'wb') as dst:
+            # Reserve the final size up front so large .blend payloads are
+            # allocated in one go rather than extent by extent
+            if _posix_fallocate is not None and member.file_size:
+                try:
+                    _posix_fallocate(dst.fileno(), 0, member.file_size)
+                except OSError:
+                    pass
+            shutil.copyfileobj(src, dst, _COPY_BUFSZ)
+
+    return len(targets)
+
+def _extract_libarchive(zip_path, extract_path):
+    """Extract `zip_path` with libarchive-c, sanitizing names like ZipFile.extract."""
+    made_dirs = set()
+    file_count = 0
+    with _libarchive.file_reader(zip_path) as archive:
+        for entry in archive:
+            parts = _member_target_parts(entry.pathname)
+            if not parts:
+                continue
+            target = os.path.join(extract_path, *parts)
+
+            if entry.isdir:
+                if target not in made_dirs:
+                    os.makedirs(target, exist_ok=True)
+                    made_dirs.add(target)
+                continue
+            if not entry.isfile:
+                # Links and special files are never part of content packs
+                continue
+
+            parent = os.path.dirname(target)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
+
+            with open(target, 'wb') as dst:
+                for block in entry.get_blocks():
+                    dst.write(block)
+            file_count += 1
+
+    return file_count
+
+def safe_extractall(zip_ref, extract_path, max_path_length=200, zip_path=None):
     """
     Safely extract ZIP files with Windows long path handling.
     Uses even more aggressive path length limits and temporary short paths.
@@ -94,26 +235,36 @@ def safe_extractall(zip_ref, extract_path, max_path_length=200):
                 potential_path = os.path.join(extract_path, zip_info.filename)
                 if len(potential_path) > max_path_length:
                     needs_short_path = True
-                    print(f"CloneX: Detected potential long path in ZIP: {len(potential_path)} chars")
+                    log.debug("CloneX: Detected potential long path in ZIP: %d chars", len(potential_path))
                     break
         except:
             pass
     
     if needs_short_path:
-        print(f"CloneX: Long path detected ({len(extract_path)} chars), using temp extraction...")
+        # Write straight to the final location through the \\\\?\\ prefix, which
+        # lifts MAX_PATH without extracting everything twice
+        try:
+            file_count = _extract_members_direct(zip_ref, _to_long_path(extract_path))
+            log.info("CloneX: Extracted %d files to long path %s", file_count, extract_path)
+            return
+        except OSError as e:
+            log.warning("CloneX: Direct long-path extraction failed (%s), falling back to temp extraction...", e)
+
+        log.info("CloneX: Long path detected (%d chars), using temp extraction...", len(extract_path))
         
         # Create temporary extraction directory with very short path
         temp_extract_dir = create_safe_temp_dir(os.path.basename(extract_path))
         
         try:
             # Extract to temporary directory first
-            zip_ref.extractall(temp_extract_dir)
+            _extract_members_direct(zip_ref, temp_extract_dir)
             
             # Create final destination directory
             os.makedirs(extract_path, exist_ok=True)
             
-            # Move files from temp to final destination with progress
-            file_count = 0
+            # Gather every (src, dest) pair and destination directory first
+            move_pairs = []
+            dest_dirs = set()
             for root, dirs, files in os.walk(temp_extract_dir):
                 # Calculate relative path from temp directory
                 rel_path = os.path.relpath(root, temp_extract_dir)
@@ -122,35 +273,42 @@ def safe_extractall(zip_ref, extract_path, max_path_length=200):
                 else:
                     dest_root = os.path.join(extract_path, rel_path)
                 
-                # Create destination directories
-                if not os.path.exists(dest_root):
-                    try:
-                        os.makedirs(dest_root, exist_ok=True)
-                    except Exception as e:
-                        print(f"CloneX: Warning - Could not create directory {dest_root}: {e}")
-                        continue
-                
-                # Move files
+                dest_dirs.add(dest_root)
                 for file in files:
-                    src_file = os.path.join(root, file)
-                    dest_file = os.path.join(dest_root, file)
-                    
+                    move_pairs.append((os.path.join(root, file), os.path.join(dest_root, file)))
+            
+            # Create destination directories once, parents first
+            failed_dirs = set()
+            for dest_root in sorted(dest_dirs, key=len):
+                try:
+                    os.makedirs(dest_root, exist_ok=True)
+                except Exception as e:
+                    log.warning("CloneX: Could not create directory %s: %s", dest_root, e)
+                    failed_dirs.add(dest_root)
+            
+            # Move files with a plain rename; temp and destination usually share
+            # a volume, so copying is only needed across devices
+            file_count = 0
+            for src_file, dest_file in move_pairs:
+                if os.path.dirname(dest_file) in failed_dirs:
+                    continue
+                
+                try:
                     try:
-                        shutil.move(src_file, dest_file)
-                        file_count += 1
-                    except Exception as e:
-                        print(f"CloneX: Warning - Could not move {file}: {e}")
-                        # Try copying instead
-                        try:
-                            shutil.copy2(src_file, dest_file)
-                            file_count += 1
-                        except Exception as e2:
-                            print(f"CloneX: Error - Could not copy {file}: {e2}")
+                        os.replace(src_file, dest_file)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.copy2(src_file, dest_file)
+                        os.unlink(src_file)
+                    file_count += 1
+                except Exception as e:
+                    log.error("CloneX: Could not move %s: %s", src_file, e)
             
-            print(f"CloneX: Successfully moved {file_count} files to {extract_path}")
+            log.info("CloneX: Successfully moved %d files to %s", file_count, extract_path)
             
         except Exception as e:
-            print(f"CloneX: Extraction error: {e}")
+            log.error("CloneX: Extraction error: %s", e)
             raise
         finally:
             # Clean up temporary directory
@@ -159,9 +317,119 @@ def safe_extractall(zip_ref, extract_path, max_path_length=200):
             except:
                 pass
     else:
-        # Standard extraction for normal length paths
-        zip_ref.extractall(extract_path)
+        # Prefer libarchive when installed and we know the archive's path
+        if _libarchive is not None and zip_path:
+            try:
+                _extract_libarchive(zip_path, extract_path)
+                return
+            except Exception as e:
+                log.warning("CloneX: libarchive extraction failed (%s), using zipfile...", e)
+
+        # Standard extraction for normal length paths. Directories are created
+        # once up front instead of extractall's makedirs call per member.
+        _extract_members_direct(zip_ref, extract_path)
+
+# Zips below this size are read into memory once so fallback attempts never
+# go back to (possibly cloud-synced) storage. Skipped when libarchive is
+# installed, since it re-reads the archive from disk by path anyway.
+_EXTRACT_IN_MEMORY_LIMIT = 32 * 1024 * 1024
+
+# Packs prepared concurrently on import; bounds the in-memory zip copies above
+# to a few at a time regardless of core count.
+_PACK_PREPARE_WORKERS = 4
+
+def _extract_with_fallbacks(zip_path, primary_dest, base_directory):
+    """
+    Extract `zip_path` to `primary_dest`, falling back to progressively
+    shorter destinations for Windows path limits. The zip is opened once
+    and the path hash computed once for all attempts.
+    Returns the directory the pack ended up in, or None if all attempts failed.
+    """
+    zip_name = os.path.basename(zip_path)
+
+    # Only an on-disk handle is given a path for libarchive to reopen
+    archive_path = zip_path
+    try:
+        if _libarchive is None and os.path.getsize(zip_path) < _EXTRACT_IN_MEMORY_LIMIT:
+            with open(zip_path, 'rb') as f:
+                zip_ref = zipfile.ZipFile(io.BytesIO(f.read()))
+            archive_path = None
+        else:
+            zip_ref = zipfile.ZipFile(zip_path)
+    except Exception as e:
+        log.error("CloneX: Error opening %s: %s", zip_name, e)
+        return None
+
+    path_hash = _short_hash(zip_path, 6)
+    temp_dest = os.path.join(tempfile.gettempdir(), f"cx{path_hash[:4]}")  # Very short: cx1a2b
+
+    try:
+        try:
+            log.info("CloneX: Extracting %s...", zip_name)
+            log.debug("CloneX: Target path length: %d characters", len(primary_dest))
+            
+            # Use safe extraction method for Windows long path support
+            safe_extractall(zip_ref, primary_dest, zip_path=archive_path)
+            
+            log.info("CloneX: Successfully extracted %s", zip_name)
+            return primary_dest
+        except Exception as e:
+            log.warning("CloneX: Error extracting %s: %s", zip_name, e)
+
+        # Fallback 1: Ultra-short folder name with hash
+        try:
+            ultra_short_name = f"cx_{path_hash[:6]}"
+            log.info("CloneX: Trying ultra-short extraction to %s...", ultra_short_name)
+            
+            fallback_path1 = os.path.join(base_directory, ultra_short_name)
+            safe_extractall(zip_ref, fallback_path1, zip_path=archive_path)
+            
+            log.info("CloneX: Ultra-short extraction successful")
+            return fallback_path1
+        except Exception as e2:
+            log.warning("CloneX: Ultra-short extraction failed: %s", e2)
+
+        # Fallback 2: Use Windows temp directory for even shorter paths
+        try:
+            log.info("CloneX: Trying temp directory extraction to %s...", temp_dest)
+            
+            safe_extractall(zip_ref, temp_dest, zip_path=archive_path)
+            log.info("CloneX: Temp directory extraction successful")
+            
+            # Link the intended location to the temp extraction if possible
+            if _create_junction is not None:
+                try:
+                    _create_junction(temp_dest, primary_dest)
+                    log.info("CloneX: Created junction link to temp extraction")
+                    return primary_dest
+                except OSError:
+                    pass
+
+            # If junction fails, just use the temp path directly
+            log.info("CloneX: Using temp directory directly")
+            return temp_dest
+        except Exception as e3:
+            log.warning("CloneX: Temp directory extraction failed: %s", e3)
+
+        # Fallback 3: Try direct to C:\ root for absolute shortest paths
+        try:
+            root_name = f"c{path_hash[:3]}"  # Ultra short: c1a2
+            log.info("CloneX: Trying root directory extraction to %s...", root_name)
+            
+            fallback_path3 = os.path.join("C:\\", root_name)
+            safe_extractall(zip_ref, fallback_path3, zip_path=archive_path)
+            
+            log.info("CloneX: Root directory extraction successful")
+            log.warning("CloneX: Files extracted to %s due to path limits", fallback_path3)
+            return fallback_path3
+        except Exception as e4:
+            log.error("CloneX: Root directory extraction failed: %s", e4)
 
+        return None
+    finally:
+        zip_ref.close()
+
+@lru_cache(maxsize=1024)
 def get_safe_folder_name(zip_path, base_directory=None, max_length=80, max_windows_path=200):
     """
     Return extraction folder name derived from the ZIP filename.
@@ -181,99 +449,265 @@ def get_safe_folder_name(zip_path, base_directory=None, max_length=80, max_windo
     elif len(base_name) <= max_length:
         return base_name
 
-    hash_obj = hashlib.md5(base_name.encode())
-    short_hash = hash_obj.hexdigest()[:6]
+    short_hash = _short_hash(base_name, 6)
     short_part_length = max(max_length - 8, 10)
     safe_name = f"{base_name[:short_part_length]}_{short_hash}"
 
     if len(safe_name) > max_length:
         safe_name = f"cx_{short_hash}"
 
-    print(f"CloneX: Shortened folder name from '{base_name}' to '{safe_name}'")
+    log.info("CloneX: Shortened folder name from '%s' to '%s'", base_name, safe_name)
     return safe_name
 
 # === End Long Path Support Functions ===
 
-def _dir_has_gender_base_blend(dir_path: Path, gender: str) -> bool:
-    marker = os.path.join(f"_{gender}", "_blender")
+def _scan_for_blend(root, gender: str, name_predicate) -> bool:
+    """
+    Return True as soon as a file accepted by `name_predicate` is found
+    somewhere below a `_{gender}/_blender` directory under `root`.
+    Explicit scandir walk: no per-entry stat, no per-level lists, and the
+    opposite gender's subtree is never entered.
+    """
+    gender_dir = f"_{gender}"
+    opposite_dir = "_female" if gender == "male" else "_male"
+    marker = f"{gender_dir}/_blender"
+
+    # Each entry is (path, state): 0 = outside the marker, 1 = directly in a
+    # `_{gender}` dir, 2 = inside `_{gender}/_blender` (or below it)
+    root_str = os.fspath(root)
+    normalized_root = root_str.replace("\\", "/").rstrip("/")
+    if marker in normalized_root:
+        state = 2
+    elif os.path.basename(normalized_root).endswith(gender_dir):
+        state = 1
+    else:
+        state = 0
+    pending = deque([(root_str, state)])
+
     try:
-        for root, _, files in os.walk(str(dir_path)):
-            normalized_root = root.replace("\\", "/")
-            if marker not in normalized_root:
+        while pending:
+            dir_path, state = pending.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith("."):
+                            continue
+
+                        if entry.is_dir(follow_symlinks=False):
+                            if state == 2:
+                                pending.append((entry.path, 2))
+                            elif state == 1 and name.startswith("_blender"):
+                                pending.append((entry.path, 2))
+                            elif name.endswith(gender_dir):
+                                pending.append((entry.path, 1))
+                            elif name != opposite_dir:
+                                pending.append((entry.path, 0))
+                        elif state == 2 and name_predicate(name) and entry.is_file():
+                            return True
+            except OSError:
                 continue
-            for file in files:
-                if file.startswith("."):
-                    continue
-                if file.lower().endswith(".blend"):
-                    return True
     except Exception:
         return False
     return False
 
+def _is_base_blend_name(path_str: str) -> bool:
+    return path_str.lower().endswith(".blend")
+
+def _dir_has_gender_base_blend(dir_path: Path, gender: str) -> bool:
+    return _scan_for_blend(dir_path, gender, _is_base_blend_name)
+
+# Base character packs consistently include "character" in blend filename.
+_CHAR_BLEND_RE = re.compile(r"[^/\\]*character[^/\\]*\.blend$", re.IGNORECASE)
+
 def _is_character_blend_name(path_str: str) -> bool:
-    filename = os.path.basename(path_str).lower()
-    # Base character packs consistently include "character" in blend filename.
-    return "character" in filename and filename.endswith(".blend")
+    return _CHAR_BLEND_RE.search(path_str) is not None
 
 
 def _dir_has_gender_character_blend(dir_path: Path, gender: str) -> bool:
-    marker = os.path.join(f"_{gender}", "_blender")
-    try:
-        for root, _, files in os.walk(str(dir_path)):
-            normalized_root = root.replace("\\", "/")
-            if marker not in normalized_root:
-                continue
-            for file in files:
-                if file.startswith("."):
-                    continue
-                rel = f"{normalized_root}/{file}"
-                if _is_character_blend_name(rel):
-                    return True
-    except Exception:
-        return False
-    return False
+    return _scan_for_blend(dir_path, gender, _is_character_blend_name)
+
+
+# Bit flags collected per zip by _build_zip_index
+_ZIP_MALE_BLEND = 1 << 0
+_ZIP_FEMALE_BLEND = 1 << 1
+_ZIP_MALE_CHAR_BLEND = 1 << 2
+_ZIP_FEMALE_CHAR_BLEND = 1 << 3
+_ZIP_ANY_BLEND = 1 << 4
+_ZIP_TEXTURES = 1 << 5
+_ZIP_ALL_FLAGS = (1 << 6) - 1
+
+_ZIP_TEXTURE_RE = re.compile(r"_textures?/")
+_ZIP_GENDER_BLENDER_RE = re.compile(r"_(male|female)/_blender/")
+_ZIP_GENDER_BITS = {
+    "male": (_ZIP_MALE_BLEND, _ZIP_MALE_CHAR_BLEND),
+    "female": (_ZIP_FEMALE_BLEND, _ZIP_FEMALE_CHAR_BLEND),
+}
+
+def _classify_zip_names(filenames) -> int:
+    """
+    OR every member name into a bit mask of _ZIP_* flags. Consumes
+    `filenames` lazily and stops as soon as every flag is set.
+    """
+    mask = 0
+    for name in filenames:
+        normalized = name.replace("\\", "/").lower()
+
+        if not mask & _ZIP_TEXTURES and _ZIP_TEXTURE_RE.search(normalized):
+            mask |= _ZIP_TEXTURES
+
+        if normalized.endswith(".blend") and "_blender/" in normalized:
+            mask |= _ZIP_ANY_BLEND
+            # Already lowercased and known to end in .blend: a substring test
+            # on the final component is enough
+            is_character = "character" in normalized.rpartition("/")[2]
+            for match in _ZIP_GENDER_BLENDER_RE.finditer(normalized):
+                blend_bit, char_bit = _ZIP_GENDER_BITS[match.group(1)]
+                mask |= blend_bit
+                if is_character:
+                    mask |= char_bit
+
+        if mask == _ZIP_ALL_FLAGS:
+            break
 
+    return mask
 
-def _zip_has_gender_base_blend(zip_path: Path, gender: str) -> bool:
-    marker = f"_{gender}/_blender/".lower()
+def _build_zip_index(zip_path) -> dict:
+    """
+    Read a zip's central directory once and summarize what the pack holds.
+    Member names are classified straight off infolist() in a single pass,
+    without building an intermediate name list. Returns None when the zip
+    cannot be read.
+    """
     try:
         with zipfile.ZipFile(str(zip_path)) as zf:
-            for name in zf.namelist():
-                normalized = name.replace("\\", "/").lower()
-                if marker in normalized and normalized.lower().endswith(".blend"):
-                    return True
+            mask = _classify_zip_names(zi.filename for zi in zf.infolist())
     except Exception:
-        return False
-    return False
+        return None
+
+    return {
+        "has_male_blend": bool(mask & _ZIP_MALE_BLEND),
+        "has_female_blend": bool(mask & _ZIP_FEMALE_BLEND),
+        "has_male_char_blend": bool(mask & _ZIP_MALE_CHAR_BLEND),
+        "has_female_char_blend": bool(mask & _ZIP_FEMALE_CHAR_BLEND),
+        "has_any_blend_payload": bool(mask & _ZIP_ANY_BLEND),
+        "has_textures": bool(mask & _ZIP_TEXTURES),
+    }
 
-def _zip_has_gender_character_blend(zip_path: Path, gender: str) -> bool:
-    marker = f"_{gender}/_blender/".lower()
+def _any_matching(zip_path, predicate) -> bool:
+    """True on the first member whose normalized name satisfies `predicate`."""
     try:
         with zipfile.ZipFile(str(zip_path)) as zf:
-            for name in zf.namelist():
-                normalized = name.replace("\\", "/").lower()
-                if marker in normalized and _is_character_blend_name(normalized):
-                    return True
+            return any(
+                predicate(zi.filename.replace("\\", "/").lower())
+                for zi in zf.infolist()
+            )
     except Exception:
         return False
-    return False
 
+# Written into a pack folder after a successful extraction so later imports
+# can trust the folder and reuse the zip index without reopening the zip.
+_EXTRACT_FINGERPRINT_NAME = ".clonex_extracted.json"
+
+def _zip_fingerprint(zip_path) -> dict:
+    stat = os.stat(zip_path)
+    return {"size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+def _read_extract_record(extract_dir, zip_path) -> dict:
+    """
+    Return the fingerprint record stored in `extract_dir` when it was written
+    for the current size/mtime of `zip_path`, otherwise None.
+    """
+    try:
+        with open(os.path.join(extract_dir, _EXTRACT_FINGERPRINT_NAME), 'r') as f:
+            data = json.load(f)
+        if data.get("zip") == _zip_fingerprint(zip_path) and isinstance(data.get("index"), dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _read_extract_fingerprint(extract_dir, zip_path) -> dict:
+    """Zip index from a matching fingerprint in `extract_dir`, otherwise None."""
+    record = _read_extract_record(extract_dir, zip_path)
+    return record["index"] if record is not None else None
+
+def _write_extract_fingerprint(extract_dir, zip_path, index, roots=None):
+    """
+    Record that `extract_dir` holds `zip_path`. `roots` maps a gender to the
+    pack root found for it (relative to `extract_dir`, None when the folder
+    is not a pack), so later imports can skip the structure scan.
+    """
+    try:
+        with open(os.path.join(extract_dir, _EXTRACT_FINGERPRINT_NAME), 'w') as f:
+            json.dump({"zip": _zip_fingerprint(zip_path), "index": index, "roots": roots or {}}, f)
+    except OSError as e:
+        log.warning("CloneX: Could not write extraction fingerprint in %s: %s", extract_dir, e)
+
+def _default_extract_dir(zip_path) -> str:
+    directory = os.path.dirname(os.fspath(zip_path))
+    return os.path.join(directory, get_safe_folder_name(os.fspath(zip_path), base_directory=directory))
+
+def _get_zip_index(zip_path, zip_indexes=None) -> dict:
+    """
+    Return the cached index for `zip_path`, building it on first use.
+    A matching fingerprint in the pack's extracted folder is used instead of
+    reading the zip.
+    """
+    key = os.fspath(zip_path)
+    if zip_indexes is not None and key in zip_indexes:
+        return zip_indexes[key]
+
+    index = _read_extract_fingerprint(_default_extract_dir(zip_path), zip_path)
+    if index is None:
+        index = _build_zip_index(zip_path)
+
+    if zip_indexes is not None:
+        zip_indexes[key] = index
+    return index
+
+def _zip_has_gender_base_blend(zip_path: Path, gender: str, index=None) -> bool:
+    if index is None:
+        # Single question without an index: stop at the first hit
+        marker = f"_{gender}/_blender/"
+        return _any_matching(zip_path, lambda n: marker in n and n.endswith(".blend"))
+    return index[f"has_{gender}_blend"]
+
+def _zip_has_gender_character_blend(zip_path: Path, gender: str, index=None) -> bool:
+    if index is None:
+        marker = f"_{gender}/_blender/"
+        return _any_matching(zip_path, lambda n: marker in n and _is_character_blend_name(n))
+    return index[f"has_{gender}_char_blend"]
 
-def _detect_base_gender_availability(root_dir: Path):
+
+def _likely_base_pack_first(entry):
+    name = os.path.basename(entry[0]).lower()
+    return not ("character" in name or "combined" in name)
+
+def _detect_base_gender_availability(root_dir: Path, zip_indexes=None, required_gender=None):
+    """
+    Report which genders have base character payloads under `root_dir`.
+    Stops early once `required_gender` is confirmed, or once both genders
+    are found when no gender is required.
+    """
     availability = {"male": False, "female": False, "found_base": False}
-    entries = list(root_dir.iterdir())
-    zip_entries = [p for p in entries if p.suffix.lower() == ".zip"]
+    with os.scandir(root_dir) as it:
+        entries = [(e.path, _is_zip_name(e.name), e.is_dir()) for e in it]
+    zip_entries = [e for e in entries if e[1]]
     # Prefer zip packages when present to avoid expensive recursive scans over
     # previously extracted directories in cloud-synced folders.
     candidates = zip_entries if zip_entries else entries
+    # Try names that usually hold the base character first so we exit sooner
+    candidates.sort(key=_likely_base_pack_first)
 
-    for path in candidates:
-        if path.is_dir():
+    for path, is_zip, is_dir in candidates:
+        if is_dir:
             has_m = _dir_has_gender_character_blend(path, "male")
             has_f = _dir_has_gender_character_blend(path, "female")
-        elif path.suffix.lower() == ".zip":
-            has_m = _zip_has_gender_character_blend(path, "male")
-            has_f = _zip_has_gender_character_blend(path, "female")
+        elif is_zip:
+            index = _get_zip_index(path, zip_indexes)
+            has_m = _zip_has_gender_character_blend(path, "male", index)
+            has_f = _zip_has_gender_character_blend(path, "female", index)
         else:
             continue
 
@@ -281,34 +715,26 @@ def _detect_base_gender_availability(root_dir: Path):
             availability["found_base"] = True
             availability["male"] = availability["male"] or has_m
             availability["female"] = availability["female"] or has_f
+
+            if required_gender is not None:
+                if availability[required_gender]:
+                    break
+            elif availability["male"] and availability["female"]:
+                break
     return availability
 
-def _zip_relevant_for_gender(zip_path: Path, gender: str, is_base_pack: bool) -> bool:
+def _zip_relevant_for_gender(zip_path: Path, gender: str, is_base_pack: bool, index=None) -> bool:
     """Fast zip prefilter to avoid extracting irrelevant packs."""
-    selected_blender_marker = f"_{gender}/_blender/".lower()
-    texture_markers = ("_texture/", "_textures/")
     opposite_gender = "female" if gender == "male" else "male"
-    opposite_blender_marker = f"_{opposite_gender}/_blender/".lower()
 
-    try:
-        with zipfile.ZipFile(str(zip_path)) as zf:
-            names = [n.replace("\\", "/").lower() for n in zf.namelist()]
-    except Exception:
+    index = index if index is not None else _build_zip_index(zip_path)
+    if index is None:
         return True
 
-    has_selected_blend = any(
-        selected_blender_marker in n and n.lower().endswith(".blend")
-        for n in names
-    )
-    has_opposite_blend = any(
-        opposite_blender_marker in n and n.lower().endswith(".blend")
-        for n in names
-    )
-    has_any_blend_payload = any("_blender/" in n and n.endswith(".blend") for n in names)
-    has_textures = any(
-        any(marker in n for marker in texture_markers)
-        for n in names
-    )
+    has_selected_blend = index[f"has_{gender}_blend"]
+    has_opposite_blend = index[f"has_{opposite_gender}_blend"]
+    has_any_blend_payload = index["has_any_blend_payload"]
+    has_textures = index["has_textures"]
 
     if is_base_pack:
         # Base packs must contain selected gender blend data.
@@ -335,6 +761,161 @@ def _zip_relevant_for_gender(zip_path: Path, gender: str, is_base_pack: bool) ->
     return True
 
 
+def _scandir_children(path):
+    """Return {name: DirEntry} for path, or an empty dict if it can't be read."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _first_blend(path):
+    """Name of the first .blend file in path, or None; stops at the first hit.
+
+    Dot-prefixed names (macOS ``._*`` resource forks) and non-files are
+    skipped, as alistdir did.
+    """
+    try:
+        with os.scandir(path) as it:
+            return next((e.name for e in it
+                         if not e.name.startswith('.')
+                         and e.name.lower().endswith('.blend')
+                         and e.is_file()), None)
+    except OSError:
+        return None
+
+
+# path -> (st_mtime_ns, {name: DirEntry}); reimporting the same packs answers
+# directory questions from here until a folder's mtime changes. Cleared on
+# register/unregister and by Refresh Content Packs.
+_dir_cache = {}
+
+
+def _cached_children(path):
+    path = str(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _dir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    children = _scandir_children(path)
+    _dir_cache[path] = (mtime, children)
+    return children
+
+
+@lru_cache(maxsize=1)
+def _addon_catalog_bytes() -> bytes:
+    """Bundled blender_assets.cats.txt, read once per session."""
+    return (Path(__file__).resolve().parent / 'assets' / 'blender_assets.cats.txt').read_bytes()
+
+def _is_zip_name(name: str) -> bool:
+    return name.rpartition('.')[2].lower() == 'zip'
+
+def _find_pack_root(path, gender: str):
+    """
+    Folder that holds the pack's `_{gender}`/`_texture(s)` structure: `path`
+    itself, or its single nested `*Combined` folder when extraction used a
+    shortened name. None when `path` does not look like a pack.
+    """
+    path = Path(path)
+    try:
+        # One scandir answers every structure question below
+        with os.scandir(path) as it:
+            subdirs = {e.name: e.path for e in it if e.is_dir()}
+    except OSError:
+        return None
+
+    nested_combined = [p for name, p in subdirs.items() if name.endswith('Combined')]
+    if path.name.endswith('Combined'):
+        return path
+    if len(nested_combined) == 1:
+        return Path(nested_combined[0])
+
+    gender_dir = subdirs.get(f"_{gender}")
+    has_gender_blender = gender_dir is not None and os.path.isdir(os.path.join(gender_dir, "_blender"))
+    has_texture_dir = "_texture" in subdirs or "_textures" in subdirs
+    if has_gender_blender or has_texture_dir:
+        return path
+    return None
+
+def _prepare_pack(entry, gender: str, directory: str, zip_indexes=None) -> dict:
+    """
+    Classify one (path, name, is_dir) entry of the import folder and extract
+    it when it is a relevant zip. Touches no Blender data, so it is safe to
+    run in a worker thread. Returns a dict describing the prepared pack;
+    `verified` is set when the extracted folder is known to match the zip's
+    index, and `root` is the pack root to import from (None to ignore it).
+    """
+    path, name, is_dir = entry
+    pack = {
+        "name": name,
+        "path": Path(path),
+        "root": None,
+        "is_base_path": False,
+        "skipped": False,
+        "failed": False,
+        "verified": False,
+    }
+
+    # Do not rely on pack filename conventions (e.g. generic Combined.zip).
+    if is_dir:
+        pack["is_base_path"] = _dir_has_gender_character_blend(path, gender)
+        pack["root"] = _find_pack_root(path, gender)
+        return pack
+
+    if not _is_zip_name(name):
+        return pack
+
+    # Generate safe folder name to avoid Windows path length issues
+    folder_name = get_safe_folder_name(path, base_directory=directory)
+    trait_dir_path = os.path.join(directory, folder_name)
+
+    # A fingerprint from an earlier import lets us skip the zip entirely
+    record = _read_extract_record(trait_dir_path, path)
+    if record is not None:
+        zip_index = record["index"]
+        pack["verified"] = True
+    else:
+        zip_index = _get_zip_index(path, zip_indexes)
+    pack["is_base_path"] = _zip_has_gender_character_blend(path, gender, zip_index)
+
+    if not _zip_relevant_for_gender(path, gender, pack["is_base_path"], zip_index):
+        log.info("CloneX: Skipping zip '%s' - no selected gender ('%s') payload found.", name, gender)
+        pack["skipped"] = True
+        return pack
+
+    # Without a matching fingerprint an existing folder may be stale or only
+    # partly extracted, so extract again over it
+    roots = record.get("roots", {}) if record is not None else {}
+    if not pack["verified"]:
+        extracted_path = _extract_with_fallbacks(path, trait_dir_path, directory)
+
+        if extracted_path is None:
+            pack["failed"] = True
+            return pack
+
+        trait_dir_path = extracted_path
+
+    if pack["verified"] and gender in roots:
+        # Structure recorded at extraction time: no directory scan needed
+        root = roots[gender]
+        pack["root"] = Path(trait_dir_path) / root if root is not None else None
+    else:
+        pack["root"] = _find_pack_root(trait_dir_path, gender)
+        if zip_index is not None:
+            roots[gender] = os.path.relpath(pack["root"], trait_dir_path) if pack["root"] is not None else None
+            _write_extract_fingerprint(trait_dir_path, path, zip_index, roots)
+            pack["verified"] = True
+
+    # Always resolve to the extracted folder path, whether it was
+    # created in this run or already existed from prior imports.
+    pack["path"] = Path(trait_dir_path)
+    return pack
+
+
 class CT_OT_CloneSelectOperator(Operator):
     """Use the file browser to select the folder containing your 3D files"""
     
@@ -354,9 +935,13 @@ class CT_OT_CloneSelectOperator(Operator):
 
         # Fast preflight: if a base pack exists but doesn't contain the selected
         # gender payload, fail early instead of entering a long import/extract path.
-        availability = _detect_base_gender_availability(Path(self.directory))
+        # Each zip's central directory is read once and shared by every probe below
+        zip_indexes = {}
+        selected_gender = clone_props.gender.lower()
+        availability = _detect_base_gender_availability(
+            Path(self.directory), zip_indexes, required_gender=selected_gender
+        )
         if availability["found_base"]:
-            selected_gender = clone_props.gender.lower()
             opposite_gender = "female" if selected_gender == "male" else "male"
             if not availability.get(selected_gender, False) and availability.get(opposite_gender, False):
                 self.report(
@@ -371,31 +956,23 @@ class CT_OT_CloneSelectOperator(Operator):
         
         # If CloneX Style Library doesn't exist yet, setup the asset catalog
         # for the current file
-        library_exists = False
-
-        for al in bpy.context.preferences.filepaths.asset_libraries:
-            if al.name == 'CloneX Style Library':
-                library_exists = True
+        style_lib_path = ctutils.get_style_library_path()
+        library_exists = bool(style_lib_path)
         
         if not library_exists:
-            src_path = os.path.join(Path(__file__).resolve().parent, 'assets', 'blender_assets.cats.txt')
             dest_path = os.path.join(clone_props.home_dir, 'blender_assets.cats.txt')
-            shutil.copy(src_path, dest_path)
+            with open(dest_path, 'wb') as f:
+                f.write(_addon_catalog_bytes())
             # Avoid blocking saves into cloud-synced import folders during import.
             # Users can save manually after import if needed.
         else:
             # If the asset library already exists, copy the catalog so it can be used in
             # the local file and load the existing assets into the working file
-            style_lib_path = ''
-
-            for al in bpy.context.preferences.filepaths.asset_libraries:
-                if al.name == 'CloneX Style Library':
-                    style_lib_path = al.path
-
             if style_lib_path != '':
                 src_path = os.path.join(style_lib_path, 'blender_assets.cats.txt')
                 dest_path = os.path.join(clone_props.home_dir, 'blender_assets.cats.txt')
-                shutil.copy(src_path, dest_path)
+                # Contents only; the catalog needs none of copy()'s mode bits
+                shutil.copyfile(src_path, dest_path)
 
                 with bpy.data.libraries.load(
                         os.path.join(style_lib_path, 'clonex_style_library.blend'),
@@ -405,162 +982,56 @@ class CT_OT_CloneSelectOperator(Operator):
 
         trait_dir_paths = []
 
-        entries = list(Path(self.directory).iterdir())
-        zip_entries = [p for p in entries if p.suffix.lower() == '.zip']
+        # (path, name, is_dir) straight from scandir; Path objects are only
+        # created once a pack has been prepared
+        with os.scandir(self.directory) as it:
+            entries = [(e.path, e.name, e.is_dir()) for e in it]
+        zip_entries = [e for e in entries if _is_zip_name(e[1])]
         # If zip packs exist, process only zips to avoid rescanning extracted
         # directories from previous runs (major source of perceived hangs).
         input_entries = zip_entries if zip_entries else entries
 
+        # Zip probing and extraction release the GIL (zlib, file I/O), so packs
+        # are prepared in parallel. Blender data is only touched below, on the
+        # main thread, in the original pack order.
+        # Operator and scene properties are read here, on the main thread;
+        # workers only ever see these plain locals
+        gender = clone_props.gender.lower()
+        directory = self.directory
+        if len(input_entries) < 2:
+            prepared_packs = [
+                _prepare_pack(entry, gender, directory, zip_indexes) for entry in input_entries
+            ]
+        else:
+            # Capped: each worker may hold a whole zip in memory while it extracts
+            max_workers = min(_PACK_PREPARE_WORKERS, len(input_entries), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                prepared_packs = list(pool.map(
+                    lambda entry: _prepare_pack(entry, gender, directory, zip_indexes),
+                    input_entries
+                ))
+
         # Load the base clone objects
-        for path in input_entries:
-            # Do not rely on pack filename conventions (e.g. generic Combined.zip).
-            if path.is_dir():
-                is_base_path = _dir_has_gender_character_blend(path, clone_props.gender.lower())
-            elif path.suffix.lower() == '.zip':
-                is_base_path = _zip_has_gender_character_blend(path, clone_props.gender.lower())
-            else:
-                is_base_path = False
-            trait_dir_path = ''
-            
-            if path.suffix == '.zip':
-                if not _zip_relevant_for_gender(path, clone_props.gender.lower(), is_base_path):
-                    print(
-                        f"CloneX: Skipping zip '{path.name}' - "
-                        f"no selected gender ('{clone_props.gender}') payload found."
-                    )
-                    continue
+        for pack in prepared_packs:
+            if pack["skipped"]:
+                continue
 
-                # Generate safe folder name to avoid Windows path length issues
-                folder_name = get_safe_folder_name(str(path), base_directory=self.directory)
-                trait_dir_path = os.path.join(self.directory, folder_name)
+            if pack["failed"]:
+                self.report({'ERROR'}, f"Could not extract {pack['name']}: All extraction methods failed")
+                print(f"CloneX: CRITICAL - All extraction attempts failed for {pack['name']}")
+                continue  # Skip this file and continue with others
 
-                # Unzip if zip file and directory doesn't already exist
-                if not Path(trait_dir_path).is_dir():             
-                    try:
-                        print(f"CloneX: Extracting {path.name}...")
-                        print(f"CloneX: Target path length: {len(trait_dir_path)} characters")
-                        
-                        # Use safe extraction method for Windows long path support
-                        with zipfile.ZipFile(path) as zip_ref:
-                            safe_extractall(zip_ref, trait_dir_path)
-                        
-                        print(f"CloneX: Successfully extracted {path.name}")
-                        
-                    except Exception as e:
-                        print(f"CloneX: Error extracting {path.name}: {str(e)}")
-                        # Try multiple fallback approaches for extremely long paths
-                        success = False
-                        
-                        # Fallback 1: Ultra-short folder name with hash
-                        if not success:
-                            try:
-                                hash_obj = hashlib.md5(str(path).encode())
-                                ultra_short_name = f"cx_{hash_obj.hexdigest()[:6]}"
-                                fallback_path1 = os.path.join(self.directory, ultra_short_name)
-                                
-                                print(f"CloneX: Trying ultra-short extraction to {ultra_short_name}...")
-                                
-                                with zipfile.ZipFile(path) as zip_ref:
-                                    safe_extractall(zip_ref, fallback_path1)
-                                
-                                trait_dir_path = fallback_path1
-                                success = True
-                                print(f"CloneX: Ultra-short extraction successful")
-                                
-                            except Exception as e2:
-                                print(f"CloneX: Ultra-short extraction failed: {str(e2)}")
-                        
-                        # Fallback 2: Use Windows temp directory for even shorter paths
-                        if not success:
-                            try:
-                                import tempfile
-                                temp_base = tempfile.gettempdir()  # Usually C:\Users\USER\AppData\Local\Temp
-                                hash_obj = hashlib.md5(str(path).encode())
-                                temp_name = f"cx{hash_obj.hexdigest()[:4]}"  # Very short: cx1a2b
-                                fallback_path2 = os.path.join(temp_base, temp_name)
-                                
-                                print(f"CloneX: Trying temp directory extraction to {temp_name}...")
-                                
-                                with zipfile.ZipFile(path) as zip_ref:
-                                    safe_extractall(zip_ref, fallback_path2)
-                                
-                                # Create a symlink or copy to the intended location if possible
-                                try:
-                                    # Try to create a junction/symlink
-                                    import subprocess
-                                    result = subprocess.run([
-                                        'mklink', '/J', trait_dir_path, fallback_path2
-                                    ], shell=True, capture_output=True, text=True)
-                                    
-                                    if result.returncode == 0:
-                                        print(f"CloneX: Created junction link to temp extraction")
-                                    else:
-                                        # If junction fails, just use the temp path directly
-                                        trait_dir_path = fallback_path2
-                                        print(f"CloneX: Using temp directory directly")
-                                    
-                                except Exception:
-                                    # If junction fails, just use the temp path
-                                    trait_dir_path = fallback_path2
-                                    print(f"CloneX: Using temp directory fallback")
-                                
-                                success = True
-                                print(f"CloneX: Temp directory extraction successful")
-                                
-                            except Exception as e3:
-                                print(f"CloneX: Temp directory extraction failed: {str(e3)}")
-                        
-                        # Fallback 3: Try direct to C:\ root for absolute shortest paths
-                        if not success:
-                            try:
-                                hash_obj = hashlib.md5(str(path).encode())
-                                root_name = f"c{hash_obj.hexdigest()[:3]}"  # Ultra short: c1a2
-                                fallback_path3 = os.path.join("C:\\", root_name)
-                                
-                                print(f"CloneX: Trying root directory extraction to {root_name}...")
-                                
-                                with zipfile.ZipFile(path) as zip_ref:
-                                    safe_extractall(zip_ref, fallback_path3)
-                                
-                                trait_dir_path = fallback_path3
-                                success = True
-                                print(f"CloneX: Root directory extraction successful")
-                                print(f"CloneX: WARNING - Files extracted to {fallback_path3} due to path limits")
-                                
-                            except Exception as e4:
-                                print(f"CloneX: Root directory extraction failed: {str(e4)}")
-                        
-                        if not success:
-                            self.report({'ERROR'}, f"Could not extract {path.name}: All extraction methods failed")
-                            print(f"CloneX: CRITICAL - All extraction attempts failed for {path.name}")
-                            continue  # Skip this file and continue with others
-
-                # Always resolve to the extracted folder path, whether it was
-                # created in this run or already existed from prior imports.
-                path = Path(trait_dir_path)
-            else:
-                trait_dir_path = Path(os.path.join(self.directory, path.name))  
-
-            if path.is_dir():
-                # Some extraction paths use shortened folder names that do not end with
-                # "Combined". Detect trait/base packages by expected internal structure.
-                nested_combined = [p for p in path.iterdir() if p.is_dir() and p.name.endswith('Combined')]
-                if path.name.endswith('Combined'):
-                    normalized_path = path
-                elif len(nested_combined) == 1:
-                    normalized_path = nested_combined[0]
-                else:
-                    has_gender_blender = (path / f"_{clone_props.gender}" / "_blender").is_dir()
-                    has_texture_dir = (path / "_texture").is_dir() or (path / "_textures").is_dir()
-                    if has_gender_blender or has_texture_dir:
-                        normalized_path = path
-                    else:
-                        continue
+            is_base_path = pack["is_base_path"]
 
-                path = normalized_path
+            # Some extraction paths use shortened folder names that do not end with
+            # "Combined"; _prepare_pack resolved the real pack root from the
+            # internal structure (or from the fingerprint of a verified folder)
+            path = pack["root"]
+            if path is not None:
                 trait_dir_path = str(path)
-                if not is_base_path:
-                    is_base_path = _dir_has_gender_character_blend(path, clone_props.gender.lower())
+                # is_base_path was settled in _prepare_pack from the zip index
+                # (or one walk of a plain folder); normalizing into a nested
+                # Combined folder can't add a base payload, so don't walk again
 
                 if is_base_path:
                     armature = get_object('Genesis8_1' + clone_props.gender.capitalize())
@@ -571,7 +1042,9 @@ class CT_OT_CloneSelectOperator(Operator):
 
                     try:
                         full_path = os.path.join(trait_dir_path, '_' + clone_props.gender, '_blender')
-                        blend_file = ctutils.alistdir(full_path)[0]
+                        blend_file = _first_blend(full_path)
+                        if blend_file is None:
+                            raise FileNotFoundError(f"no .blend file in {full_path}")
                         base_clone_filepath = os.path.join(full_path, blend_file) 
 
                         if not collection_exists('Character'):
@@ -616,18 +1089,23 @@ class CT_OT_CloneSelectOperator(Operator):
                 else:
                     trait_dir_paths.append(path)  
 
+        # Packs share a handful of parent folders, so each is resolved once and
+        # the trait folder name is appended to it
+        resolved_parents = {}
+        skipped_traits = []
+
         # All directories should be extracted now so we can load traits and update armature mods
         for trait_dir_path in trait_dir_paths:
             trait_dir_name = trait_dir_path.name.lower()
             trait_display_name = ctutils.format_trait_display_name(trait_dir_path.name, clone_props.gender)
+            # One directory read answers every existence question for this trait
+            children = _cached_children(trait_dir_path)
+            texture_dir = '_texture' if '_texture' in children else '_textures'
             
             if 'dna' in trait_dir_name:
                 # This is a texture for the head
                 head_geo = ctutils.get_head_geo()
-                filepath = os.path.join(trait_dir_path, '_texture')
-
-                if not os.path.exists(filepath):
-                    filepath = os.path.join(trait_dir_path, '_textures')
+                filepath = os.path.join(trait_dir_path, texture_dir)
                 
                 if head_geo:
                     # Strip off gender prefix for DNA trait names
@@ -638,10 +1116,11 @@ class CT_OT_CloneSelectOperator(Operator):
             if 'suit' in trait_dir_name:
                 # This is a texture for the suit
                 suit_geo = ctutils.get_suit_geo()
-                filepath = os.path.join(trait_dir_path, '_textures', 'suit_' + get_scene().clone_props.gender)
+                suit_dir = 'suit_' + clone_props.gender
+                filepath = os.path.join(trait_dir_path, '_textures', suit_dir)
 
-                if not os.path.exists(filepath):
-                    filepath = os.path.join(trait_dir_path, '_texture', 'suit_' + get_scene().clone_props.gender)
+                if '_textures' not in children or not os.path.exists(filepath):
+                    filepath = os.path.join(trait_dir_path, '_texture', suit_dir)
                 
                 if suit_geo:
                     print('Applying DNA texture to suit')
@@ -653,10 +1132,7 @@ class CT_OT_CloneSelectOperator(Operator):
                 # Two of the Facial Features are more than textures so skip them
                 # here and treat them like all other mesh traits
                 if not 'angry' in trait_dir_name.lower() and not 'band' in trait_dir_name.lower():
-                    filepath = os.path.join(trait_dir_path, '_texture')
-
-                    if not os.path.exists(filepath):
-                        filepath = os.path.join(trait_dir_path, '_textures')
+                    filepath = os.path.join(trait_dir_path, texture_dir)
 
                     # Strip of gender prefix for facial feature trait names
                     ctutils.apply_facial_feature(filepath, 'ff_' + trait_display_name[2:])
@@ -667,35 +1143,44 @@ class CT_OT_CloneSelectOperator(Operator):
             full_path = os.path.join(trait_dir_path, '_' + clone_props.gender, '_blender')
             
             try:
-                blend_files = ctutils.alistdir(full_path)
-                if not blend_files:
-                    print(f"CloneX: Warning - No blend files found in {full_path}")
-                    print(
-                        f"CloneX: Skipping trait '{trait_dir_path.name}' - "
-                        f"no selected gender ('{clone_props.gender}') blend payload."
+                # Walk down through the cached DirEntry objects; is_dir() reuses
+                # the file type readdir already returned
+                blend_file = None
+                gender_entry = children.get('_' + clone_props.gender)
+                if gender_entry is not None and gender_entry.is_dir():
+                    blender_entry = _cached_children(gender_entry.path).get('_blender')
+                    if blender_entry is not None and blender_entry.is_dir():
+                        blend_file = _first_blend(blender_entry.path)
+                if not blend_file:
+                    skipped_traits.append(
+                        f"{trait_dir_path.name}: no selected gender ('{clone_props.gender}') "
+                        f"blend payload in {full_path}"
                     )
                     continue
                 
-                if not blend_files:
-                    print(f"CloneX: Skipping {trait_dir_path} - no .blend files found")
-                    continue
-                
-                blend_file = blend_files[0]
                 trait_display_name = Path(blend_file).stem.replace('rigged_', '')
                 
+                parent = trait_dir_path.parent
+                resolved_parent = resolved_parents.get(parent)
+                if resolved_parent is None:
+                    resolved_parent = resolved_parents[parent] = str(parent.resolve())
+
                 item = clone_props.trait_collection.add()
-                item.trait_dir = str(trait_dir_path.resolve()) if hasattr(trait_dir_path, 'resolve') else str(trait_dir_path)
+                item.trait_dir = os.path.join(resolved_parent, trait_dir_path.name)
                 item.name = trait_display_name
                 item.trait_selected = True
                 
                 print(f"CloneX: Successfully added trait: {trait_display_name}")
                 
-            except Exception as e:
-                print(f"CloneX: Error processing {trait_dir_path}: {str(e)}")
-                print(f"CloneX: Skipping this asset and continuing...")
+            except OSError as e:
+                skipped_traits.append(f"{trait_dir_path}: {e}")
                 continue   
 
-        print(self.directory)
+        # One console write for every trait that was passed over
+        if skipped_traits:
+            print("CloneX: Skipped %d trait(s):\n  %s" % (len(skipped_traits), "\n  ".join(skipped_traits)))
+
+        log.debug("CloneX: Imported clone from %s", self.directory)
         # clone_props.home_dir = self.directory
         clone_props.files_loaded = True
 
@@ -703,11 +1188,8 @@ class CT_OT_CloneSelectOperator(Operator):
         ctutils.load_env_from_blendfile(context)
         ctutils.setup(context)
 
-        # Path to the blendshape_renamer.py script
-        script_file = os.path.join(os.path.dirname(__file__), "blendshape_renamer.py")
-
-        with open(script_file, 'r') as file:
-            exec(file.read())
+        # Normalize ARKit shape key names on the freshly loaded clone
+        blendshape_renamer.rename_all_shape_keys(context)
         
         # === ENHANCED CLONE TOOLS AUTO-FIXES ===
         clone_props = get_scene().clone_props
@@ -912,50 +1394,32 @@ class CT_OT_ApplyFacialFeatureOperator(Operator):
         return {'FINISHED'}
 
 
-def _get_collection_bounds(coll_name):
-    coll = bpy.data.collections.get(coll_name)
-    if not coll:
+def _aabb_of_objects(objs):
+    """World-space (min, max) Vectors over the bound boxes of objs, or (None, None)."""
+    world_corners = []
+    for obj in objs:
+        matrix = obj.matrix_world
+        corners = np.array([tuple(corner) for corner in obj.bound_box])
+        world_corners.append(corners @ np.array(matrix.to_3x3()).T + np.array(matrix.translation))
+
+    if not world_corners:
         return None, None
+    stacked = np.vstack(world_corners)
+    return mathutils.Vector(stacked.min(axis=0)), mathutils.Vector(stacked.max(axis=0))
 
-    min_vec = mathutils.Vector((1e10, 1e10, 1e10))
-    max_vec = mathutils.Vector((-1e10, -1e10, -1e10))
-    found_any = False
 
-    for obj in coll.all_objects:
-        if obj.type != 'MESH':
-            continue
-        found_any = True
-        bbox = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-        for corner in bbox:
-            min_vec.x = min(min_vec.x, corner.x)
-            min_vec.y = min(min_vec.y, corner.y)
-            min_vec.z = min(min_vec.z, corner.z)
-            max_vec.x = max(max_vec.x, corner.x)
-            max_vec.y = max(max_vec.y, corner.y)
-            max_vec.z = max(max_vec.z, corner.z)
-
-    if not found_any:
+def _get_collection_bounds(coll_name):
+    coll = bpy.data.collections.get(coll_name)
+    if not coll:
         return None, None
-    return min_vec, max_vec
+    return _aabb_of_objects(obj for obj in coll.all_objects if obj.type == 'MESH')
 
 
 def _get_head_bounds():
     head_obj = ctutils.get_head_geo()
     if head_obj is None:
         return None, None
-
-    min_vec = mathutils.Vector((1e10, 1e10, 1e10))
-    max_vec = mathutils.Vector((-1e10, -1e10, -1e10))
-    for corner in head_obj.bound_box:
-        world_corner = head_obj.matrix_world @ mathutils.Vector(corner)
-        min_vec.x = min(min_vec.x, world_corner.x)
-        min_vec.y = min(min_vec.y, world_corner.y)
-        min_vec.z = min(min_vec.z, world_corner.z)
-        max_vec.x = max(max_vec.x, world_corner.x)
-        max_vec.y = max(max_vec.y, world_corner.y)
-        max_vec.z = max(max_vec.z, world_corner.z)
-
-    return min_vec, max_vec
+    return _aabb_of_objects((head_obj,))
 
 
 def _compute_distance_for_fill(bbox_height, fill_percent=0.8, lens_mm=50.0, sensor_height_mm=24.0):
@@ -974,7 +1438,6 @@ def _create_character_sheet_cameras(preset_name, body_count=10, include_closeups
         center_body = (body_min + body_max) * 0.5
         height_body = max(0.001, body_max.z - body_min.z)
         dist_body = _compute_distance_for_fill(height_body, fill_percent=0.8, lens_mm=50.0)
-        step_deg = 360.0 / float(max(1, body_count))
 
         directional_labels = [
             "Front",
@@ -987,15 +1450,15 @@ def _create_character_sheet_cameras(preset_name, body_count=10, include_closeups
             "Right Front",
         ]
 
-        for i in range(body_count):
-            angle_deg = i * step_deg
-            angle_rad = math.radians(angle_deg)
-            loc_x = center_body.x + dist_body * math.sin(angle_rad)
-            loc_y = center_body.y - dist_body * math.cos(angle_rad)
-            loc_z = center_body.z
-            direction = (center_body - mathutils.Vector((loc_x, loc_y, loc_z))).normalized()
-            rot_eul = direction.to_track_quat('-Z', 'Y').to_euler()
+        # Every camera sits level with the target on a ring around it, so
+        # aiming it is a quarter turn about X (look along +Y) followed by the
+        # ring angle about Z; no track quaternion needed
+        angles = np.linspace(0.0, 2.0 * math.pi, max(0, body_count), endpoint=False)
+        ring_x = (center_body.x + dist_body * np.sin(angles)).tolist()
+        ring_y = (center_body.y - dist_body * np.cos(angles)).tolist()
+        loc_z = center_body.z
 
+        for i, (loc_x, loc_y, angle_rad) in enumerate(zip(ring_x, ring_y, angles.tolist())):
             if body_count == 8:
                 shot_label = directional_labels[i]
             else:
@@ -1004,7 +1467,7 @@ def _create_character_sheet_cameras(preset_name, body_count=10, include_closeups
             cameras.append({
                 "name": f"Body_{shot_label}",
                 "location": (loc_x, loc_y, loc_z),
-                "rotation": (rot_eul.x, rot_eul.y, rot_eul.z),
+                "rotation": (math.pi / 2, 0.0, angle_rad),
                 "lens": 50.0,
             })
 
@@ -1015,25 +1478,121 @@ def _create_character_sheet_cameras(preset_name, body_count=10, include_closeups
             height_head = max(0.001, head_max.z - head_min.z)
             dist_head = _compute_distance_for_fill(height_head, fill_percent=0.6, lens_mm=60.0)
 
-            closeup_angles = [(0, "CloseFront"), (45, "Close3Q"), (90, "CloseSide")]
-            for angle_deg, label in closeup_angles:
-                angle_rad = math.radians(angle_deg)
-                loc_x = center_head.x + dist_head * math.sin(angle_rad)
-                loc_y = center_head.y - dist_head * math.cos(angle_rad)
-                loc_z = center_head.z
-                direction = (center_head - mathutils.Vector((loc_x, loc_y, loc_z))).normalized()
-                rot_eul = direction.to_track_quat('-Z', 'Y').to_euler()
+            closeup_labels = ("CloseFront", "Close3Q", "CloseSide")
+            angles = np.radians([0.0, 45.0, 90.0])
+            ring_x = (center_head.x + dist_head * np.sin(angles)).tolist()
+            ring_y = (center_head.y - dist_head * np.cos(angles)).tolist()
+            loc_z = center_head.z
 
+            for label, loc_x, loc_y, angle_rad in zip(closeup_labels, ring_x, ring_y, angles.tolist()):
                 cameras.append({
                     "name": label,
                     "location": (loc_x, loc_y, loc_z),
-                    "rotation": (rot_eul.x, rot_eul.y, rot_eul.z),
+                    "rotation": (math.pi / 2, 0.0, angle_rad),
                     "lens": 60.0,
                 })
 
     return cameras
 
 
+def _pixels_to_np(image, buffer=None):
+    # Reads into `buffer` when it is large enough, so callers looping over
+    # many images can reuse one allocation. The result is then a view of it.
+    width, height = image.size
+    count = width * height * 4
+    if buffer is not None and buffer.size >= count:
+        pixels = buffer[:count]
+    else:
+        pixels = np.empty(count, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+
+def _decode_rgba(path):
+    # Same layout as _pixels_to_np: float RGBA, bottom row first like Blender
+    with _PILImage.open(path) as img:
+        pixels = np.asarray(img.convert('RGBA'), dtype=np.float32)
+    pixels /= 255.0
+    return pixels[::-1]
+
+
+def _iter_decoded_shots(shots, window=2):
+    """
+    Yield (slot, pixels) for {slot: path} in order. Pillow decodes at most
+    `window` files ahead of the caller, so only a few shots are held in
+    memory while the sheet is composited; pixels is None where Pillow is
+    missing or can't read the file.
+    """
+    if _PILImage is None:
+        for slot in shots:
+            yield slot, None
+        return
+
+    order = list(shots.items())
+    # Slots sharing a file decode it once; it is dropped after its last slot
+    remaining = {}
+    for _, path in order:
+        remaining[path] = remaining.get(path, 0) + 1
+
+    pending = {}
+    with ThreadPoolExecutor(max_workers=window) as pool:
+        for i, (slot, path) in enumerate(order):
+            for _, ahead in order[i:i + window]:
+                if ahead not in pending:
+                    pending[ahead] = pool.submit(_decode_rgba, ahead)
+
+            try:
+                pixels = pending[path].result()
+            except Exception as ex:
+                log.debug("Pillow could not decode %s, using Blender: %s", path, ex)
+                pixels = None
+
+            remaining[path] -= 1
+            if not remaining[path]:
+                del pending[path]
+            yield slot, pixels
+
+
+def _build_contact_sheet_vips(shot_items, output_path, sheet_name, columns, transparent):
+    tiles = []
+    for item in shot_items:
+        path = item.get("path", "")
+        if not path or not os.path.exists(path):
+            continue
+        scale = float(item.get("scale", 1.0))
+        if scale <= 0:
+            continue
+
+        tile = _pyvips.Image.new_from_file(path, access='sequential')
+        if scale != 1.0:
+            tile = tile.resize(scale)
+        # Common 8-bit sRGB + alpha layout so arrayjoin doesn't mix formats
+        if tile.interpretation != 'srgb' or tile.format != 'uchar':
+            tile = tile.colourspace('srgb')
+        if not tile.hasalpha():
+            tile = tile.bandjoin(255)
+        tiles.append(tile)
+
+    if not tiles:
+        return None
+
+    # Same layout as the NumPy grid: max-size cells, row 0 at the top,
+    # each shot centred in its cell
+    joined = _pyvips.Image.arrayjoin(
+        tiles,
+        across=max(1, columns),
+        halign='centre',
+        valign='centre',
+        background=[0, 0, 0, 0 if transparent else 255]
+    )
+    if not transparent:
+        joined = joined.extract_band(0, n=3)
+
+    sheet_path = os.path.join(output_path, f"{sheet_name}_sheet.png")
+    joined.write_to_file(sheet_path)
+    return sheet_path
+
+
 def _build_contact_sheet(shot_items, output_path, sheet_name, columns, transparent):
     if not shot_items:
         return None
@@ -1048,6 +1607,12 @@ def _build_contact_sheet(shot_items, output_path, sheet_name, columns, transpare
     if a4_sheet:
         return a4_sheet
 
+    if _pyvips is not None:
+        try:
+            return _build_contact_sheet_vips(shot_items, output_path, sheet_name, columns, transparent)
+        except Exception as ex:
+            log.debug("pyvips contact sheet failed, using Blender images: %s", ex)
+
     loaded_images = []
     processed_images = []
     try:
@@ -1069,18 +1634,13 @@ def _build_contact_sheet(shot_items, output_path, sheet_name, columns, transpare
             if scaled_w != base_w or scaled_h != base_h:
                 image.scale(scaled_w, scaled_h)
 
-            processed_images.append({
-                "name": item.get("name", os.path.basename(path)),
-                "width": int(image.size[0]),
-                "height": int(image.size[1]),
-                "pixels": list(image.pixels[:]),
-            })
+            processed_images.append(_pixels_to_np(image))
 
         if not processed_images:
             return None
 
-        cell_w = max(img["width"] for img in processed_images)
-        cell_h = max(img["height"] for img in processed_images)
+        cell_w = max(img.shape[1] for img in processed_images)
+        cell_h = max(img.shape[0] for img in processed_images)
 
         cols = max(1, columns)
         rows = (len(processed_images) + cols - 1) // cols
@@ -1088,26 +1648,18 @@ def _build_contact_sheet(shot_items, output_path, sheet_name, columns, transpare
         sheet_h = cell_h * rows
 
         bg_alpha = 0.0 if transparent else 1.0
-        sheet_pixels = [0.0, 0.0, 0.0, bg_alpha] * (sheet_w * sheet_h)
+        sheet = np.zeros((sheet_h, sheet_w, 4), dtype=np.float32)
+        sheet[..., 3] = bg_alpha
 
-        for index, image_data in enumerate(processed_images):
-            src_w = image_data["width"]
-            src_h = image_data["height"]
-            src_pixels = image_data["pixels"]
+        for index, src in enumerate(processed_images):
+            src_h, src_w = src.shape[:2]
             col = index % cols
             row = index // cols
             cell_x = col * cell_w
             cell_y = (rows - 1 - row) * cell_h
             dest_x = cell_x + max(0, (cell_w - src_w) // 2)
             dest_y = cell_y + max(0, (cell_h - src_h) // 2)
-
-            for y in range(src_h):
-                src_row_start = y * src_w * 4
-                src_row_end = src_row_start + (src_w * 4)
-                dest_row = dest_y + y
-                dest_start = (dest_row * sheet_w + dest_x) * 4
-                dest_end = dest_start + (src_w * 4)
-                sheet_pixels[dest_start:dest_end] = src_pixels[src_row_start:src_row_end]
+            sheet[dest_y:dest_y + src_h, dest_x:dest_x + src_w] = src
 
         sheet_image = bpy.data.images.new(
             name=f"CT_CharacterSheet_{sheet_name}",
@@ -1115,7 +1667,7 @@ def _build_contact_sheet(shot_items, output_path, sheet_name, columns, transpare
             height=sheet_h,
             alpha=transparent
         )
-        sheet_image.pixels = sheet_pixels
+        sheet_image.pixels.foreach_set(sheet.ravel())
         sheet_image.filepath_raw = os.path.join(output_path, f"{sheet_name}_sheet.png")
         sheet_image.file_format = 'PNG'
         sheet_image.save()
@@ -1145,87 +1697,99 @@ def _selected_sheet_items(ctglobals):
     return items
 
 
+# Deletes ASCII punctuation, whitespace and control characters
+_SHOT_NAME_DELETE = str.maketrans('', '', ''.join(ch for ch in map(chr, range(128)) if not ch.isalnum()))
+
+
+@lru_cache(maxsize=256)
 def _normalize_shot_name(value):
     base = os.path.splitext(os.path.basename(value))[0]
-    return ''.join(ch for ch in base.lower() if ch.isalnum())
+    return base.lower().translate(_SHOT_NAME_DELETE)
+
+
+# Normalized shot name fragment -> A4 slot. Checked in order, so closeups
+# win over body views when both fragments appear in a name.
+_SLOT_MAP = {
+    'close3q': 'close_3q',
+    'closefront': 'close_front',
+    'closeside': 'close_side',
+    'bodyleftfront': 'left_front',
+    'bodyleftside': 'left_side',
+    'bodyleftback': 'left_back',
+    'bodyrightfront': 'right_front',
+    'bodyrightside': 'right_side',
+    'bodyrightback': 'right_back',
+    'bodyback': 'back',
+    'bodyfront': 'front',
+}
 
 
 def _shot_slot_key(value):
     key = _normalize_shot_name(value)
-    # closeups
-    if 'close3q' in key:
-        return 'close_3q'
-    if 'closefront' in key:
-        return 'close_front'
-    if 'closeside' in key:
-        return 'close_side'
-    # body views
-    if 'bodyleftfront' in key:
-        return 'left_front'
-    if 'bodyleftside' in key:
-        return 'left_side'
-    if 'bodyleftback' in key:
-        return 'left_back'
-    if 'bodyrightfront' in key:
-        return 'right_front'
-    if 'bodyrightside' in key:
-        return 'right_side'
-    if 'bodyrightback' in key:
-        return 'right_back'
-    if 'bodyback' in key:
-        return 'back'
-    if 'bodyfront' in key:
-        return 'front'
+    # Generated shot files normalize to an exact key
+    slot = _SLOT_MAP.get(key)
+    if slot is not None:
+        return slot
+    for fragment, slot in _SLOT_MAP.items():
+        if fragment in key:
+            return slot
     return None
 
 
-def _alpha_crop_bounds(image_pixels, src_w, src_h, alpha_threshold=0.01):
-    min_x = src_w
-    min_y = src_h
-    max_x = -1
-    max_y = -1
-
-    for y in range(src_h):
-        row = y * src_w * 4
-        for x in range(src_w):
-            alpha = image_pixels[row + (x * 4) + 3]
-            if alpha > alpha_threshold:
-                if x < min_x:
-                    min_x = x
-                if y < min_y:
-                    min_y = y
-                if x > max_x:
-                    max_x = x
-                if y > max_y:
-                    max_y = y
-
-    if max_x < min_x or max_y < min_y:
+def _alpha_crop_bounds(image_pixels, alpha_threshold=0.01):
+    mask = image_pixels[..., 3] > alpha_threshold
+    rows = mask.any(axis=1)
+    if not rows.any():
         return None
-    return (min_x, min_y, (max_x - min_x + 1), (max_y - min_y + 1))
+    cols = mask.any(axis=0)
+    min_y, max_y = np.flatnonzero(rows)[[0, -1]]
+    min_x, max_x = np.flatnonzero(cols)[[0, -1]]
+    return (int(min_x), int(min_y), int(max_x - min_x + 1), int(max_y - min_y + 1))
+
+
+def _resample_axis(start, end, offset, src_len, dst_len):
+    # Source sample positions for destination pixel centres [start, end),
+    # as the two neighbouring indices and the weight of the second one
+    pos = (np.arange(start, end, dtype=np.float32) - offset + 0.5) * (src_len / dst_len) - 0.5
+    np.clip(pos, 0, src_len - 1, out=pos)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, src_len - 1)
+    return lo, hi, pos - lo
+
+
+def _blit_scaled(sheet, src, dst_x, dst_y, dst_w, dst_h):
+    # Bilinear resample, clip and copy straight into the sheet array
+    sheet_h, sheet_w = sheet.shape[:2]
+    x_start, x_end = max(0, dst_x), min(sheet_w, dst_x + dst_w)
+    y_start, y_end = max(0, dst_y), min(sheet_h, dst_y + dst_h)
+    if x_start >= x_end or y_start >= y_end:
+        return
+
+    src_h, src_w = src.shape[:2]
+    y0, y1, wy = _resample_axis(y_start, y_end, dst_y, src_h, dst_h)
+    x0, x1, wx = _resample_axis(x_start, x_end, dst_x, src_w, dst_w)
+    wy = wy[:, None, None]
+    wx = wx[None, :, None]
+
+    top = src[y0[:, None], x0] * (1.0 - wx) + src[y0[:, None], x1] * wx
+    bottom = src[y1[:, None], x0] * (1.0 - wx) + src[y1[:, None], x1] * wx
+    sheet[y_start:y_end, x_start:x_end] = top * (1.0 - wy) + bottom * wy
 
 
-def _copy_image_into_region(sheet_pixels, sheet_w, sheet_h, image_pixels, src_w, src_h, x0, y0, w, h, scale=1.0, crop_alpha=True):
+def _copy_image_into_region(sheet, image_pixels, x0, y0, w, h, scale=1.0, crop_alpha=True):
+    src_h, src_w = image_pixels.shape[:2]
     if src_w <= 0 or src_h <= 0 or w <= 0 or h <= 0:
         return
 
-    crop_x = 0
-    crop_y = 0
     crop_w = src_w
     crop_h = src_h
     source_pixels = image_pixels
 
     if crop_alpha:
-        bounds = _alpha_crop_bounds(image_pixels, src_w, src_h)
+        bounds = _alpha_crop_bounds(image_pixels)
         if bounds is not None:
             crop_x, crop_y, crop_w, crop_h = bounds
-            if crop_w > 0 and crop_h > 0 and (crop_w != src_w or crop_h != src_h):
-                cropped = [0.0, 0.0, 0.0, 0.0] * (crop_w * crop_h)
-                for y in range(crop_h):
-                    src_row_start = ((crop_y + y) * src_w + crop_x) * 4
-                    src_row_end = src_row_start + (crop_w * 4)
-                    dst_row_start = y * crop_w * 4
-                    cropped[dst_row_start:dst_row_start + (crop_w * 4)] = image_pixels[src_row_start:src_row_end]
-                source_pixels = cropped
+            source_pixels = image_pixels[crop_y:crop_y + crop_h, crop_x:crop_x + crop_w]
 
     fit = min(float(w) / float(crop_w), float(h) / float(crop_h))
     fit *= max(0.1, scale)
@@ -1236,65 +1800,17 @@ def _copy_image_into_region(sheet_pixels, sheet_w, sheet_h, image_pixels, src_w,
     dst_x = x0 + max(0, (w - dst_w) // 2)
     dst_y = y0 + max(0, (h - dst_h) // 2)
 
-    # temporary image for scaling
-    temp_img = bpy.data.images.new(name="CT_TempSheetScale", width=crop_w, height=crop_h, alpha=True)
-    try:
-        temp_img.pixels = source_pixels
-        temp_img.scale(dst_w, dst_h)
-        scaled = list(temp_img.pixels[:])
-    finally:
-        bpy.data.images.remove(temp_img)
-
-    # write into destination, clipping to canvas bounds
-    for y in range(dst_h):
-        src_row_start = y * dst_w * 4
-        src_row_end = src_row_start + (dst_w * 4)
-        dest_row = dst_y + y
-        if dest_row < 0 or dest_row >= sheet_h:
-            continue
-        dest_start = (dest_row * sheet_w + dst_x) * 4
-        dest_end = dest_start + (dst_w * 4)
-        # clip horizontal bounds
-        if dst_x < 0 or dst_x + dst_w > sheet_w:
-            for x in range(dst_w):
-                target_x = dst_x + x
-                if target_x < 0 or target_x >= sheet_w:
-                    continue
-                s = src_row_start + x * 4
-                d = (dest_row * sheet_w + target_x) * 4
-                sheet_pixels[d:d+4] = scaled[s:s+4]
-        else:
-            sheet_pixels[dest_start:dest_end] = scaled[src_row_start:src_row_end]
+    _blit_scaled(sheet, source_pixels, dst_x, dst_y, dst_w, dst_h)
 
 
-def _build_a4_default_sheet(shot_items, output_path, sheet_name, transparent):
-    # Map selected shots into named slots.
-    slot_items = {}
-    for item in shot_items:
-        slot = _shot_slot_key(item.get("name", ""))
-        if slot is None:
-            slot = _shot_slot_key(item.get("path", ""))
-        if slot is None:
-            continue
-        if slot not in slot_items:
-            slot_items[slot] = item
+# A4 landscape at 300 DPI.
+_A4_SHEET_W = 3508
+_A4_SHEET_H = 2480
 
-    # Require the core slots to use the fixed A4 layout.
-    required = {
-        'front', 'left_front', 'left_side', 'left_back',
-        'right_front', 'right_side', 'right_back', 'back',
-        'close_front', 'close_side', 'close_3q'
-    }
-    if not required.issubset(set(slot_items.keys())):
-        return None
 
-    # A4 landscape at 300 DPI.
-    sheet_w = 3508
-    sheet_h = 2480
-    margin = 56
-    gutter = 24
-    content_w = sheet_w - (margin * 2)
-    content_h = sheet_h - (margin * 2)
+def _a4_regions(margin=56, gutter=24):
+    content_w = _A4_SHEET_W - (margin * 2)
+    content_h = _A4_SHEET_H - (margin * 2)
 
     # Revised preset:
     # Top row: Front, Left Front, Left Side, Left Back, Close 3Q, Close Side
@@ -1306,7 +1822,7 @@ def _build_a4_default_sheet(shot_items, output_path, sheet_name, transparent):
     y_bottom = margin
     y_top = margin + row_h + gutter
 
-    regions = {
+    return {
         'front': (x_left + (col_w + gutter) * 0, y_top, col_w, row_h),
         'left_front': (x_left + (col_w + gutter) * 1, y_top, col_w, row_h),
         'left_side': (x_left + (col_w + gutter) * 2, y_top, col_w, row_h),
@@ -1325,31 +1841,65 @@ def _build_a4_default_sheet(shot_items, output_path, sheet_name, transparent):
         ),
     }
 
+
+# The layout never changes, so it is computed once at import
+_A4_REGIONS = _a4_regions()
+_A4_REQUIRED = frozenset(_A4_REGIONS)
+
+
+def _build_a4_default_sheet(shot_items, output_path, sheet_name, transparent):
+    # Map selected shots into named slots.
+    slot_items = {}
+    for item in shot_items:
+        slot = _shot_slot_key(item.get("name", ""))
+        if slot is None:
+            slot = _shot_slot_key(item.get("path", ""))
+        if slot is None:
+            continue
+        if slot not in slot_items:
+            slot_items[slot] = item
+
+    # Require the core slots to use the fixed A4 layout.
+    if not _A4_REQUIRED.issubset(slot_items):
+        return None
+
+    sheet_w = _A4_SHEET_W
+    sheet_h = _A4_SHEET_H
     bg_alpha = 0.0 if transparent else 1.0
-    sheet_pixels = [0.0, 0.0, 0.0, bg_alpha] * (sheet_w * sheet_h)
-    loaded = []
+    sheet = np.zeros((sheet_h, sheet_w, 4), dtype=np.float32)
+    sheet[..., 3] = bg_alpha
+    shot_paths = {}
+    for slot in _A4_REGIONS:
+        shot_path = slot_items[slot].get("path", "")
+        if shot_path and os.path.exists(shot_path):
+            shot_paths[slot] = os.path.realpath(shot_path)
+
+    # realpath -> image; a file mapped to several slots is loaded once and
+    # everything loaded here is removed again in the finally
+    image_cache = {}
+    # Shot pixels are read into one float32 buffer, grown to the largest shot
+    scratch = None
     try:
-        for slot, region in regions.items():
-            shot = slot_items.get(slot)
-            if not shot:
-                continue
-            shot_path = shot.get("path", "")
-            if not shot_path or not os.path.exists(shot_path):
-                continue
-
-            image = bpy.data.images.load(shot_path, check_existing=False)
-            loaded.append(image)
-            src_w = int(image.size[0])
-            src_h = int(image.size[1])
-            pixels = list(image.pixels[:])
+        # With Pillow available the next PNG decodes while this one is pasted
+        # and never enters bpy.data; anything it can't read goes through Blender
+        for slot, pixels in _iter_decoded_shots(shot_paths):
+            shot_path = shot_paths[slot]
+            shot = slot_items[slot]
+            region = _A4_REGIONS[slot]
+
+            if pixels is None:
+                image = image_cache.get(shot_path)
+                if image is None:
+                    image = bpy.data.images.load(shot_path, check_existing=False)
+                    image_cache[shot_path] = image
+                need = int(image.size[0]) * int(image.size[1]) * 4
+                if scratch is None or scratch.size < need:
+                    scratch = np.empty(need, dtype=np.float32)
+                pixels = _pixels_to_np(image, scratch)
             x0, y0, w, h = region
             _copy_image_into_region(
-                sheet_pixels=sheet_pixels,
-                sheet_w=sheet_w,
-                sheet_h=sheet_h,
+                sheet=sheet,
                 image_pixels=pixels,
-                src_w=src_w,
-                src_h=src_h,
                 x0=x0,
                 y0=y0,
                 w=w,
@@ -1363,14 +1913,14 @@ def _build_a4_default_sheet(shot_items, output_path, sheet_name, transparent):
             height=sheet_h,
             alpha=transparent
         )
-        sheet_image.pixels = sheet_pixels
+        sheet_image.pixels.foreach_set(sheet.ravel())
         sheet_path = os.path.join(output_path, f"{sheet_name}_sheet_a4.png")
         sheet_image.filepath_raw = sheet_path
         sheet_image.file_format = 'PNG'
         sheet_image.save()
         return sheet_path
     finally:
-        for image in loaded:
+        for image in image_cache.values():
             try:
                 bpy.data.images.remove(image)
             except Exception:
@@ -1524,6 +2074,94 @@ class CT_OT_ExportOperator(Operator):
         return {'RUNNING_MODAL'}
 
 
+# Runs inside each background Blender started by _render_views_in_subprocesses.
+# argv after "--" is a JSON job file: {"shots": [{location, rotation, lens, filepath}]}
+_CHARSHEET_WORKER_SCRIPT = """
+import bpy, json, os, sys
+with open(sys.argv[sys.argv.index('--') + 1]) as f:
+    job = json.load(f)
+scene = bpy.context.scene
+cam_data = bpy.data.cameras.new(name='CT_CharSheetCamData')
+cam_data.dof.use_dof = False
+cam_obj = bpy.data.objects.new(name='CT_CharSheetCam', object_data=cam_data)
+scene.collection.objects.link(cam_obj)
+scene.camera = cam_obj
+for shot in job['shots']:
+    cam_obj.location = shot['location']
+    cam_obj.rotation_euler = shot['rotation']
+    cam_data.lens = shot['lens']
+    scene.render.filepath = shot['filepath']
+    bpy.ops.render.render(write_still=True)
+    # Report each written file as soon as it exists, so a crash later in the
+    # job still leaves the finished shots listed
+    if os.path.isfile(shot['filepath']):
+        with open(job['done_path'], 'a') as done:
+            done.write(shot['filepath'] + '\\n')
+"""
+
+
+def _render_views_in_subprocesses(render_jobs, process_count):
+    """
+    Render (camera, filepath) jobs across background Blender processes, one per
+    GPU index, and return the filepaths that were written, in job order.
+    The scene, including the render settings already applied by the caller, is
+    handed over as a temporary copy of the current file.
+    """
+    process_count = max(1, min(process_count, len(render_jobs)))
+    work_dir = tempfile.mkdtemp(prefix='ct_charsheet_')
+    try:
+        blend_copy = os.path.join(work_dir, 'charsheet.blend')
+        bpy.ops.wm.save_as_mainfile(filepath=blend_copy, copy=True)
+
+        commands = []
+        done_paths = []
+        for gpu_index in range(process_count):
+            shots = [
+                {
+                    "location": list(cam["location"]),
+                    "rotation": list(cam["rotation"]),
+                    "lens": cam["lens"],
+                    "filepath": filepath,
+                }
+                for cam, filepath in render_jobs[gpu_index::process_count]
+            ]
+            job_path = os.path.join(work_dir, f'job_{gpu_index}.json')
+            done_path = os.path.join(work_dir, f'done_{gpu_index}.txt')
+            done_paths.append(done_path)
+            with open(job_path, 'w') as f:
+                json.dump({"shots": shots, "done_path": done_path}, f)
+            args = [
+                bpy.app.binary_path, '-b', blend_copy,
+                '--python-expr', _CHARSHEET_WORKER_SCRIPT, '--', job_path
+            ]
+            env = dict(os.environ, CUDA_VISIBLE_DEVICES=str(gpu_index))
+            commands.append((args, env))
+
+        def run(command):
+            args, env = command
+            result = subprocess.run(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                print(f"CloneX: Character sheet render process failed ({result.returncode}): "
+                      f"{result.stderr.decode(errors='replace').strip()[-500:]}")
+
+        with ThreadPoolExecutor(max_workers=process_count) as pool:
+            list(pool.map(run, commands))
+
+        # Only paths a worker reported writing count as rendered, never files
+        # left over from an earlier run
+        written = set()
+        for done_path in done_paths:
+            try:
+                with open(done_path) as f:
+                    written.update(line.rstrip('\n') for line in f if line.strip())
+            except OSError:
+                pass
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return [filepath for _, filepath in render_jobs if filepath in written]
+
+
 class CT_OT_RenderCharacterSheet(Operator):
     """Render a multi-view character sheet from generated body and closeup cameras."""
 
@@ -1553,47 +2191,65 @@ class CT_OT_RenderCharacterSheet(Operator):
         original_transparent = scene.render.film_transparent
         original_format = scene.render.image_settings.file_format
         original_color_mode = scene.render.image_settings.color_mode
+        original_compression = scene.render.image_settings.compression
+        original_persistent_data = scene.render.use_persistent_data
 
         scene.render.image_settings.file_format = 'PNG'
+        if ctglobals.charsheet_fast_png:
+            scene.render.image_settings.compression = 15
+        # Only the camera changes between views; keep Cycles' synced scene
+        # instead of rebuilding it for every shot
+        scene.render.use_persistent_data = True
         scene.render.film_transparent = ctglobals.charsheet_transparent_bg
         scene.render.image_settings.color_mode = 'RGBA' if ctglobals.charsheet_transparent_bg else 'RGB'
-        ctglobals.charsheet_shots.clear()
 
         rendered_count = 0
         rendered_paths = []
+        render_processes = ctglobals.charsheet_render_processes
+        cam_data = None
+        cam_obj = None
         try:
-            for index, cam in enumerate(cameras):
-                cam_data = bpy.data.cameras.new(name=f"CT_CharSheetCamData_{index:02}")
-                cam_obj = bpy.data.objects.new(name=f"CT_CharSheetCam_{index:02}", object_data=cam_data)
+            if render_processes > 1:
+                render_jobs = [
+                    (cam, os.path.join(output_path, f"{preset_name}_{cam['name']}.png"))
+                    for cam in cameras
+                ]
+                rendered_paths = _render_views_in_subprocesses(render_jobs, render_processes)
+                rendered_count = len(rendered_paths)
+            else:
+                # One camera is moved between views so the scene graph is only
+                # rebuilt once, not once per shot
+                cam_data = bpy.data.cameras.new(name="CT_CharSheetCamData")
+                cam_data.dof.use_dof = False
+                cam_obj = bpy.data.objects.new(name="CT_CharSheetCam", object_data=cam_data)
                 scene.collection.objects.link(cam_obj)
-
-                cam_obj.location = cam["location"]
-                cam_obj.rotation_euler = cam["rotation"]
-                cam_obj.data.lens = cam["lens"]
-                cam_obj.data.dof.use_dof = False
-
                 scene.camera = cam_obj
-                filename = f"{preset_name}_{cam['name']}.png"
-                render_filepath = os.path.join(output_path, filename)
-                scene.render.filepath = render_filepath
-                bpy.ops.render.render(write_still=True)
-                rendered_count += 1
-                rendered_paths.append(render_filepath)
-
-                shot = ctglobals.charsheet_shots.add()
-                shot.name = filename
-                shot.file_path = render_filepath
-                shot.include_in_sheet = True
-                shot.scale = 1.0
 
-                bpy.data.objects.remove(cam_obj, do_unlink=True)
-                bpy.data.cameras.remove(cam_data, do_unlink=True)
+                for cam in cameras:
+                    cam_obj.location = cam["location"]
+                    cam_obj.rotation_euler = cam["rotation"]
+                    cam_data.lens = cam["lens"]
+
+                    filename = f"{preset_name}_{cam['name']}.png"
+                    render_filepath = os.path.join(output_path, filename)
+                    scene.render.filepath = render_filepath
+                    bpy.ops.render.render(write_still=True)
+                    rendered_count += 1
+                    rendered_paths.append(render_filepath)
         finally:
+            # Shots rendered before any failure are still listed
+            bulk_add_shots(ctglobals.charsheet_shots, rendered_paths)
             scene.camera = original_camera
+            if cam_obj is not None:
+                bpy.data.objects.remove(cam_obj, do_unlink=True)
+            if cam_data is not None:
+                bpy.data.cameras.remove(cam_data, do_unlink=True)
             scene.render.filepath = original_filepath
             scene.render.film_transparent = original_transparent
             scene.render.image_settings.file_format = original_format
             scene.render.image_settings.color_mode = original_color_mode
+            scene.render.image_settings.compression = original_compression
+            scene.render.use_persistent_data = original_persistent_data
 
         sheet_path = None
         if ctglobals.charsheet_build_page and rendered_paths:
@@ -1652,6 +2308,23 @@ class CT_OT_RebuildCharacterSheet(Operator):
         self.report({'INFO'}, f"Rebuilt stitched sheet: {sheet_path}")
         return {'FINISHED'}
 
+def _open_url(url):
+    """Hand url to the desktop's opener without waiting for it to start."""
+    try:
+        if os.name == 'nt':
+            os.startfile(url)
+        else:
+            opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+            subprocess.Popen(
+                [opener, url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+    except OSError:
+        # No opener on PATH (e.g. minimal Linux installs)
+        webbrowser.open(url)
+
 class CT_OT_MixamoButton(Operator):
     """Launch Mixamo.com in your web browser"""
 
@@ -1659,7 +2332,7 @@ class CT_OT_MixamoButton(Operator):
     bl_label = 'Launch Mixamo'
 
     def execute(self, context):
-        webbrowser.open('https://www.mixamo.com')
+        _open_url('https://www.mixamo.com')
 
         return {'FINISHED'}
 
@@ -1704,13 +2377,7 @@ class CT_OT_SyncStyleLibraryButton(Operator):
     bl_label = 'Sync Style Library'        
 
     def execute(self, context):
-        path = ''
-
-        for al in bpy.context.preferences.filepaths.asset_libraries:
-            if al.name == 'CloneX Style Library':
-                path = al.path
-
-        ctutils.sync_assets_to_style_library(path)
+        ctutils.sync_assets_to_style_library(ctutils.get_style_library_path())
 
         return {'FINISHED'}
 
@@ -1807,36 +2474,25 @@ class CT_OT_OpenStyleLibraryButton(Operator):
     bl_label = 'Open Style Library'
 
     def execute(self, context):
-        already_open = False
-
         # Create a handler that sets the initial filter state of the
         # AssetBrowser when opened as the Style Library
         StyleLibraryDrawingHandler(context)
 
-        # Check to see if an asset browser is already open
-        for window in bpy.context.window_manager.windows:
-            screen = window.screen
-            
-            for area in screen.areas:
-                if area.ui_type == "ASSETS":
-                    already_open = True
-
-        if not already_open:
-            areas = []
+        windows = bpy.context.window_manager.windows
 
-            for window in bpy.context.window_manager.windows:
-                screen = window.screen
-                
-                for area in screen.areas:
-                    areas.append(area)
+        # any() stops at the first asset browser, which is the common case
+        already_open = any(
+            area.ui_type == "ASSETS" for window in windows for area in window.screen.areas
+        )
 
+        if not already_open:
+            # Snapshot the areas so the one created by the split can be found
+            pre_areas = {area for window in windows for area in window.screen.areas}
             bpy.ops.screen.area_split(direction='VERTICAL', factor=0.25)
             
-            for window in bpy.context.window_manager.windows:
-                screen = window.screen
-                
-                for area in screen.areas:
-                    if area not in areas:
+            for window in windows:
+                for area in window.screen.areas:
+                    if area not in pre_areas:
                         area.ui_type = 'ASSETS'
                         
                         # Don't show poses when opening style library
@@ -1864,39 +2520,46 @@ class CT_OT_FinalizeImportOperator(Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context):
+        # Every lookup is bound once up front
         trait_coll = get_collection(self.asset_name)
+        asset_data = trait_coll.asset_data if trait_coll else None
 
-        if trait_coll and trait_coll.asset_data:
-            # Assign the asset to the selected asset category
-            trait_coll.asset_data.catalog_id = \
-                context.scene.clone_props.asset_catalog_names
-            
-            # Assign the specified gender as a tag and then loop
-            # through any additional tags specified by the user and 
-            # assign them to the asset as well
-            trait_coll.asset_data.tags.new(self.asset_gender, skip_if_exists=True)
+        if asset_data is None:
+            self.report({'WARNING'}, f"Imported style '{self.asset_name}' was not found as an asset")
+            return {'CANCELLED'}
 
-            if self.asset_tags != '':
-                for tag in [t.strip() for t in self.asset_tags.split(',')]:
-                    trait_coll.asset_data.tags.new(tag, skip_if_exists=True)
+        clone_props = context.scene.clone_props
+
+        # Assign the asset to the selected asset category
+        asset_data.catalog_id = clone_props.asset_catalog_names
+        
+        # Assign the specified gender as a tag and then loop
+        # through any additional tags specified by the user and 
+        # assign them to the asset as well
+        # Diff against the existing tags once, so each new() can skip its own
+        # existence scan; dict.fromkeys dedupes while keeping the typed order
+        existing_tags = {t.name for t in asset_data.tags}
+        wanted_tags = dict.fromkeys(
+            tag for tag in (self.asset_gender.strip(), *(t.strip() for t in self.asset_tags.split(',')))
+            if tag
+        )
+        for tag in wanted_tags:
+            if tag not in existing_tags:
+                asset_data.tags.new(tag, skip_if_exists=False)
 
-            if self.asset_equip:
-                char_collection = get_collection('Character')
+        if self.asset_equip:
+            char_collection = get_collection('Character')
 
-                if char_collection:
-                    char_collection.children.link(trait_coll)
+            if char_collection:
+                char_collection.children.link(trait_coll)
 
-                    ctutils.unpack_asset_collection(trait_coll)
+                ctutils.unpack_asset_collection(trait_coll)
 
-                    trait = get_scene().clone_props.trait_collection.add()
-                    trait.name = self.asset_name
+                trait = clone_props.trait_collection.add()
+                trait.name = self.asset_name
 
         # Sync the asset to the style library after loading
-        style_lib_path = ''
-
-        for al in bpy.context.preferences.filepaths.asset_libraries:         
-            if al.name == 'CloneX Style Library':
-                style_lib_path = al.path
+        style_lib_path = ctutils.get_style_library_path()
 
         if style_lib_path != '':
             ctutils.sync_assets_to_style_library(style_lib_path)
@@ -2095,37 +2758,37 @@ class CT_OT_InstallContentPackOperator(Operator, ImportHelper):
 
         library_exists = False
 
-        # Unzip selected file and look for packinfo.json
+        # Metadata pass: read packinfo.json and release the archive straight away
         with zipfile.ZipFile(self.filepath) as zip_ref:
-            with zip_ref.open('packinfo.json') as packinfo:
-                data = json.loads(packinfo.read())
-                pack_name = data['pack_name']
-                pack_subdir = data['pack_subdir']
-                pack_type = data['pack_type']
-                pack_creator = data['pack_creator']
+            data = json.loads(zip_ref.read('packinfo.json'))
+        pack_name = data['pack_name']
+        pack_subdir = data['pack_subdir']
+        pack_type = data['pack_type']
+        pack_creator = data['pack_creator']
 
-            library_name = '[' + pack_creator + '] ' + pack_name
+        library_name = '[' + pack_creator + '] ' + pack_name
 
-            for al in bpy.context.preferences.filepaths.asset_libraries:
-                if al.name == library_name:
-                    library_exists = True
-                    break
+        for al in bpy.context.preferences.filepaths.asset_libraries:
+            if al.name == library_name:
+                library_exists = True
+                break
 
-            extract_dir = os.path.join(cpdir, pack_type, pack_subdir)
+        extract_dir = os.path.join(cpdir, pack_type, pack_subdir)
 
-            if not os.path.exists(extract_dir):
+        # Extraction pass: only reopen the archive when there is something to extract
+        if not os.path.exists(extract_dir):
+            with zipfile.ZipFile(self.filepath) as zip_ref:
                 try:
                     print(f"CloneX: Extracting content pack to {extract_dir}...")  
-                    safe_extractall(zip_ref, extract_dir)
+                    safe_extractall(zip_ref, extract_dir, zip_path=self.filepath)
                     print(f"CloneX: Content pack extracted successfully")
                 except Exception as e:
                     print(f"CloneX: Error extracting content pack: {str(e)}")
                     # Try with shorter path name
-                    hash_obj = hashlib.md5(extract_dir.encode())  
-                    short_name = f"cp_{hash_obj.hexdigest()[:8]}"
+                    short_name = f"cp_{_short_hash(extract_dir, 8)}"
                     fallback_dir = os.path.join(os.path.dirname(extract_dir), short_name)
                     try:
-                        safe_extractall(zip_ref, fallback_dir)
+                        safe_extractall(zip_ref, fallback_dir, zip_path=self.filepath)
                         extract_dir = fallback_dir  # Update extract_dir for later use
                         print(f"CloneX: Extracted to fallback location: {short_name}")
                     except Exception as e2:
@@ -2142,7 +2805,9 @@ class CT_OT_InstallContentPackOperator(Operator, ImportHelper):
 
         # Refresh the content pack lists
         bpy.ops.animation.refresh_content_packs(sync_type=pack_type)
-        bpy.ops.wm.save_mainfile(filepath=os.path.join(context.scene.clone_props.home_dir, 'clonetools.blend'))
+        # Serializing the whole .blend can take seconds, so only when asked
+        if context.scene.clone_props.autosave_after_pack_install:
+            bpy.ops.wm.save_mainfile(filepath=os.path.join(context.scene.clone_props.home_dir, 'clonetools.blend'))
 
         return context.window_manager.invoke_popup(self)
 
@@ -2150,6 +2815,33 @@ class CT_OT_InstallContentPackOperator(Operator, ImportHelper):
         layout = self.layout
         layout.label(text='Content Pack Loaded!')
 
+# Animation pack armature name -> {NLA strip name: action name}. Names, not
+# bpy references, so undo or reloading the pack can't leave dangling structs.
+_nla_strip_cache = {}
+
+
+def _find_nla_strip_action(source_armature, anim_data, strip_name):
+    for _ in range(2):
+        table = _nla_strip_cache.get(source_armature)
+        if table is None:
+            table = {}
+            for track in anim_data.nla_tracks:
+                for strip in track.strips:
+                    if strip.action is not None:
+                        table.setdefault(strip.name, strip.action.name)
+            _nla_strip_cache[source_armature] = table
+
+        action_name = table.get(strip_name)
+        if action_name is None:
+            return None
+        action = bpy.data.actions.get(action_name)
+        if action is not None:
+            return action
+        # Stale entry (action renamed or removed); rebuild once
+        _nla_strip_cache.pop(source_armature, None)
+    return None
+
+
 class CT_OT_ApplyAnimationAsset(Operator):
     bl_idname = "animation.apply_animation_asset"
     bl_label = "Apply Animation"
@@ -2182,11 +2874,12 @@ class CT_OT_ApplyAnimationAsset(Operator):
                     return {'CANCELLED'}
 
                 # Load the armature holding the NLA tracks for this content pack
-                with bpy.data.libraries.load(str(asset_fullpath)) as (data_from, data_to):
+                with bpy.data.libraries.load(asset_fullpath) as (data_from, data_to):
                     data_to.objects = ['Animation Armature']
 
                 # Rename the armature to keep separate references for each animation pack
                 get_object('Animation Armature').name = source_armature
+                _nla_strip_cache.pop(source_armature, None)
 
             source_arm = get_object(source_armature)
             target_arm = get_object('Genesis8_1' + props.gender.capitalize())
@@ -2197,43 +2890,45 @@ class CT_OT_ApplyAnimationAsset(Operator):
             source_anim_data = source_arm.animation_data
             target_anim_data = target_arm.animation_data
 
-            # Iterate over NLA tracks and strips from the source armature
-            # to find the strip that matches the selected animation asset
+            # Look the selected animation up by strip name instead of walking
+            # every NLA track and strip on each apply
+            source_action = None
             if source_anim_data:
-                for source_nla_track in source_anim_data.nla_tracks:
-                    for source_action_strip in source_nla_track.strips:
-                        if source_action_strip.name == get_asset_name(asset_file):
-                            frame_start = 1
-                            
-                            if self.operation == 'apply':
-                                # If this is the first animation being applied assume a new
-                                # track needs to be created. Otherwise target the first track.
-                                if len(target_anim_data.nla_tracks) == 0:
-                                    target_nla_track = target_anim_data.nla_tracks.new()
-                                    target_nla_track.name = 'Main NLA Track'
-                                else:
-                                    target_nla_track = target_anim_data.nla_tracks[0]
-
-                                    # Clear any existing action strips when applying an animation
-                                    for strip in target_nla_track.strips:
-                                        target_nla_track.strips.remove(strip)
-                            elif self.operation == 'append':
-                                target_nla_track = target_anim_data.nla_tracks[0]
-
-                                # If the NLA track already has action strips, set frame_start
-                                # to 1 frame beyond the last frame of the last strip
-                                if len(target_nla_track.strips) > 0:
-                                    frame_start = int(target_nla_track.strips[-1].frame_end + 1)
-                                
-                            # Create a new strip on the NLA track at the appropriate 
-                            # frame_start value
-                            target_nla_track.strips.new(
-                                source_action_strip.action.name,
-                                frame_start,
-                                source_action_strip.action
-                            )
-
-                            break
+                source_action = _find_nla_strip_action(source_armature, source_anim_data, get_asset_name(asset_file))
+
+            if source_action is not None:
+                frame_start = 1
+                
+                if self.operation == 'apply':
+                    # If this is the first animation being applied assume a new
+                    # track needs to be created. Otherwise target the first track.
+                    if len(target_anim_data.nla_tracks) == 0:
+                        target_nla_track = target_anim_data.nla_tracks.new()
+                        target_nla_track.name = 'Main NLA Track'
+                    else:
+                        target_nla_track = target_anim_data.nla_tracks[0]
+
+                        # Clear any existing action strips when applying an animation.
+                        # Remove from a reversed snapshot: nothing shifts down after
+                        # each removal, and no strip is skipped by mutating the
+                        # collection being iterated
+                        for strip in reversed(list(target_nla_track.strips)):
+                            target_nla_track.strips.remove(strip)
+                elif self.operation == 'append':
+                    target_nla_track = target_anim_data.nla_tracks[0]
+
+                    # If the NLA track already has action strips, set frame_start
+                    # to 1 frame beyond the last frame of the last strip
+                    if len(target_nla_track.strips) > 0:
+                        frame_start = int(target_nla_track.strips[-1].frame_end + 1)
+                    
+                # Create a new strip on the NLA track at the appropriate 
+                # frame_start value
+                target_nla_track.strips.new(
+                    source_action.name,
+                    frame_start,
+                    source_action
+                )
 
             if hasattr(target_anim_data, 'action_suitable_slots') and len(target_anim_data.action_suitable_slots) > 0:
                 try:
@@ -2245,12 +2940,28 @@ class CT_OT_ApplyAnimationAsset(Operator):
 
         return {'FINISHED'}
 
+# Expected armature name -> name of the suffixed rig last used in its place
+_target_armature_memo = {}
+
+# (pack, pose) -> (name, session_uid) of the action that pack load produced.
+# No Action references are held, so removing the action in the Outliner frees
+# it; the session_uid check stops a later datablock that reuses the name (or a
+# reloaded file) from being mistaken for the cached one.
+_loaded_pose_actions = {}
+
+
 class CT_OT_ApplyPoseFromDropdown(Operator):
     bl_idname = "animation.apply_pose_from_dropdown"
     bl_label = "Apply Pose"
     bl_description = "Applies the selected pose action to the active Clone character"
     bl_options = {"REGISTER", "UNDO"}
 
+    set_frame: BoolProperty(
+        name="Go to Frame 1",
+        description="Jump the scene to frame 1 so the pose is shown. Batch scripts can turn this off to skip the depsgraph evaluation",
+        default=True
+    )
+
     @staticmethod
     def _get_target_armature(props):
         primary_name = 'Genesis8_1' + props.gender.capitalize()
@@ -2258,16 +2969,26 @@ class CT_OT_ApplyPoseFromDropdown(Operator):
         if arm and arm.type == 'ARMATURE':
             return arm
 
-        # Fallback for suffixed duplicate names or renamed rigs.
-        for obj in bpy.data.objects:
-            if obj.type == 'ARMATURE' and primary_name in obj.name:
-                return obj
+        # A suffixed/renamed rig found earlier is re-validated by name, which
+        # is O(1) and can't go stale the way a stored object reference can
+        remembered = bpy.data.objects.get(_target_armature_memo.get(primary_name, ''))
+        if remembered is not None and remembered.type == 'ARMATURE' and primary_name in remembered.name:
+            return remembered
 
+        # Fallback for suffixed duplicate names or renamed rigs, in one pass:
+        # the first armature containing the primary name wins, otherwise
+        # the first armature of any name.
+        any_armature = None
         for obj in bpy.data.objects:
-            if obj.type == 'ARMATURE':
+            if obj.type != 'ARMATURE':
+                continue
+            if primary_name in obj.name:
+                _target_armature_memo[primary_name] = obj.name
                 return obj
+            if any_armature is None:
+                any_armature = obj
 
-        return None
+        return any_armature
 
     @staticmethod
     def _assign_action_slot(target_arm):
@@ -2296,8 +3017,17 @@ class CT_OT_ApplyPoseFromDropdown(Operator):
             self.report({'ERROR'}, 'Could not find target Clone armature')
             return {'CANCELLED'}
 
-        action = bpy.data.actions.get(selected_pose)
         selected_pack = getattr(wm, 'content_pack_poses', 'Current File')
+        cache_key = (selected_pack, selected_pose)
+        action = None
+        cached = _loaded_pose_actions.get(cache_key)
+        if cached is not None:
+            action = bpy.data.actions.get(cached[0])
+            if action is None or action.session_uid != cached[1]:
+                _loaded_pose_actions.pop(cache_key, None)
+                action = None
+        if action is None:
+            action = bpy.data.actions.get(selected_pose)
 
         if action is None and selected_pack != 'Current File':
             blend_path = ctutils.get_pose_pack_blend_path(context, selected_pack)
@@ -2306,12 +3036,22 @@ class CT_OT_ApplyPoseFromDropdown(Operator):
                 return {'CANCELLED'}
 
             try:
-                with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-                    if selected_pose not in data_from.actions:
-                        self.report({'ERROR'}, f"Pose '{selected_pose}' not found in pack")
-                        return {'CANCELLED'}
-                    data_to.actions = [selected_pose]
-                action = bpy.data.actions.get(selected_pose)
+                # Pose pack actions are normally marked as assets, so only
+                # enumerate asset datablocks first; fall back to a full read
+                # for packs whose actions were never marked.
+                for assets_only in (True, False):
+                    with bpy.data.libraries.load(blend_path, link=False, assets_only=assets_only) as (data_from, data_to):
+                        if selected_pose in data_from.actions:
+                            data_to.actions = [selected_pose]
+                    if data_to.actions:
+                        break
+                else:
+                    self.report({'ERROR'}, f"Pose '{selected_pose}' not found in pack")
+                    return {'CANCELLED'}
+
+                action = data_to.actions[0]
+                if action is not None:
+                    _loaded_pose_actions[cache_key] = (action.name, action.session_uid)
             except Exception as ex:
                 self.report({'ERROR'}, f'Could not load pose action: {ex}')
                 return {'CANCELLED'}
@@ -2320,12 +3060,20 @@ class CT_OT_ApplyPoseFromDropdown(Operator):
             self.report({'ERROR'}, 'Selected pose action is unavailable')
             return {'CANCELLED'}
 
-        if target_arm.animation_data is None:
+        anim_data = target_arm.animation_data
+        at_first_frame = context.scene.frame_current == 1
+        if anim_data is not None and anim_data.action == action and (at_first_frame or not self.set_frame):
+            # Already posed: skip the reassignment and the frame_set depsgraph pass
+            self.report({'INFO'}, f"Pose already applied: {selected_pose}")
+            return {'FINISHED'}
+
+        if anim_data is None:
             target_arm.animation_data_create()
 
         target_arm.animation_data.action = action
         self._assign_action_slot(target_arm)
-        context.scene.frame_set(1)
+        if self.set_frame and not at_first_frame:
+            context.scene.frame_set(1, subframe=0.0)
         self.report({'INFO'}, f"Applied pose: {selected_pose}")
         return {'FINISHED'}
 
@@ -2339,6 +3087,9 @@ class CT_OT_RefreshContentPacks(Operator):
 
     def execute(self, context):
         wm = context.window_manager
+        _dir_cache.clear()
+        _loaded_pose_actions.clear()
+        ctutils.clear_pose_pack_caches()
         ctutils.ensure_content_pack_asset_libraries()
 
         if self.sync_type == 'pose':
@@ -2517,28 +3268,31 @@ class CT_OT_RefreshContentPacks(Operator):
         
 #         return {'FINISHED'}
 
+_GENDER_ARM = {'male': 'Genesis8_1Male', 'female': 'Genesis8_1Female'}
+
+@lru_cache(maxsize=256)
+def _pack_type_of(path_str):
+    """Content pack type ('animations', 'poses', ...) from <type>/<pack>/<file>.blend."""
+    return os.path.basename(os.path.dirname(os.path.dirname(path_str)))
+
 def animation_menu_func(self: UIList, context: Context) -> None:
     props = context.scene.clone_props
 
     asset_file = get_context_asset(context)
-    asset_fullpath = get_asset_full_library_path(context, asset_file)
-    if asset_file is None or asset_fullpath is None:
+    if asset_file is None:
         return
 
-    pack_type = asset_fullpath.parent.parent.name
+    asset_fullpath = get_asset_full_library_path(context, asset_file)
+    if not asset_fullpath:
+        return
 
-    if pack_type == 'animations':
+    if _pack_type_of(asset_fullpath) == 'animations':
         layout = self.layout
         layout.separator()
 
-        has_nla_track = False
-        main_arm = get_object('Genesis8_1' + props.gender.capitalize())
-
-        if main_arm.animation_data is not None:
-            nla_tracks = main_arm.animation_data.nla_tracks
-
-            if len(nla_tracks) > 0:
-                has_nla_track = True
+        # Runs on every context menu draw: direct name lookup, no scan
+        main_arm = bpy.data.objects.get(_GENDER_ARM[props.gender])
+        has_nla_track = bool(main_arm and main_arm.animation_data and main_arm.animation_data.nla_tracks)
 
         layout.operator(CT_OT_ApplyAnimationAsset.bl_idname, text='Apply Animation').operation = 'apply'
 
@@ -2576,7 +3330,67 @@ def filter_style_gender_func(self, context):
 
 # === ENHANCED CLONE TOOLS OPERATORS ===
 
-class CT_OT_FixScaleMismatch(Operator):
+class _PhasedModalOperator:
+    """Runs an operator's phases one per timer tick when invoked from the UI.
+
+    Subclasses set ``_start_message``, list ``(key, status label, callable)``
+    tuples in ``_phases`` and define ``_finish(results)`` to report; each
+    callable receives the results gathered so far and its return value is
+    stored under ``key``. Between phases the UI redraws and input keeps
+    flowing, so phases re-check anything an earlier one decided on; ESC
+    cancels. ``execute`` still runs every phase back to back for scripts.
+    """
+
+    _start_message = ""
+    _phases = ()
+
+    def execute(self, context):
+        print(self._start_message)
+        results = {}
+        for key, _label, phase in self._phases:
+            results[key] = phase(results)
+        self._finish(results)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        print(self._start_message)
+        wm = context.window_manager
+        self._results = {}
+        self._phase = 0
+        self._timer = wm.event_timer_add(0.0, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._cleanup(context)
+            self.report({'INFO'}, f"{self.bl_label} cancelled")
+            return {'CANCELLED'}
+        # Leave transforms, drags and other input alone between phases
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        key, label, phase = self._phases[self._phase]
+        context.workspace.status_text_set(f"CloneX: {self.bl_label} - {label} ({self._phase + 1}/{len(self._phases)})")
+        try:
+            self._results[key] = phase(self._results)
+        except Exception:
+            self._cleanup(context)
+            raise
+
+        self._phase += 1
+        if self._phase < len(self._phases):
+            return {'RUNNING_MODAL'}
+
+        self._cleanup(context)
+        self._finish(self._results)
+        return {'FINISHED'}
+
+    def _cleanup(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+class CT_OT_FixScaleMismatch(_PhasedModalOperator, Operator):
     """Fix scale mismatch between character and traits"""
     
     bl_idname = "ct.fix_scale_mismatch"
@@ -2584,11 +3398,17 @@ class CT_OT_FixScaleMismatch(Operator):
     bl_description = "Automatically detect and fix scale inconsistencies between character and traits"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
-        print("CloneX: 🔧 Manual scale fix requested...")
-        
-        if ctutils.detect_scale_mismatch():
-            if ctutils.normalize_clone_scales():
+    _start_message = "CloneX: 🔧 Manual scale fix requested..."
+
+    _phases = (
+        ('mismatch', "Checking scales", lambda results: ctutils.detect_scale_mismatch()),
+        # Checked again: the scene may have changed since the first phase
+        ('normalized', "Normalizing scales", lambda results: results['mismatch'] and ctutils.detect_scale_mismatch() and ctutils.normalize_clone_scales()),
+    )
+
+    def _finish(self, results):
+        if results['mismatch']:
+            if results['normalized']:
                 self.report({'INFO'}, "Scale mismatch fixed successfully")
                 print("CloneX: ✅ Scale mismatch fixed successfully")
             else:
@@ -2597,8 +3417,6 @@ class CT_OT_FixScaleMismatch(Operator):
         else:
             self.report({'INFO'}, "No scale mismatch detected")
             print("CloneX: ✅ No scale issues found")
-        
-        return {'FINISHED'}
 
 class CT_OT_AutoPositionTraits(Operator):
     """Automatically position traits on character"""
@@ -2642,6 +3460,24 @@ class CT_OT_ForceRegisterTraits(Operator):
         
         return {'FINISHED'}
 
+class CT_OT_RenameShapeKeys(Operator):
+    """Rename ARKit shape keys to their canonical names"""
+    
+    bl_idname = "ct.rename_shape_keys"
+    bl_label = "Rename Shape Keys"
+    bl_description = "Rename ARKit facial shape keys on all meshes to their canonical names"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        renamed = blendshape_renamer.rename_all_shape_keys(context)
+        
+        if renamed:
+            self.report({'INFO'}, f"Renamed {len(renamed)} shape keys")
+        else:
+            self.report({'INFO'}, "All shape keys already use canonical names")
+        
+        return {'FINISHED'}
+
 class CT_OT_EnhancedCloneImport(Operator):
     """Complete enhanced Clone import with all automatic fixes"""
     
@@ -2677,7 +3513,7 @@ class CT_OT_EnhancedCloneImport(Operator):
         
         return {'FINISHED'}
 
-class CT_OT_AnalyzeCloneState(Operator):
+class CT_OT_AnalyzeCloneState(_PhasedModalOperator, Operator):
     """Analyze current Clone state for debugging"""
     
     bl_idname = "ct.analyze_clone_state" 
@@ -2685,13 +3521,18 @@ class CT_OT_AnalyzeCloneState(Operator):
     bl_description = "Debug tool to analyze current Clone state (scale, positioning, registration)"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        print("CloneX: 🔍 Starting Clone state analysis...")
-        
-        # Run all analysis functions
-        scale_ok = ctutils.analyze_clone_scales()
-        position_ok = ctutils.analyze_trait_positions()
-        registration_ok = ctutils.debug_trait_registration()
+    _start_message = "CloneX: 🔍 Starting Clone state analysis..."
+
+    _phases = (
+        ('scale_ok', "Checking scales", lambda results: ctutils.analyze_clone_scales()),
+        ('position_ok', "Checking trait positions", lambda results: ctutils.analyze_trait_positions()),
+        ('registration_ok', "Checking trait registration", lambda results: ctutils.debug_trait_registration()),
+    )
+
+    def _finish(self, results):
+        scale_ok = results['scale_ok']
+        position_ok = results['position_ok']
+        registration_ok = results['registration_ok']
         
         if scale_ok and position_ok and registration_ok:
             self.report({'INFO'}, "Clone state analysis: All systems normal")
@@ -2708,8 +3549,6 @@ class CT_OT_AnalyzeCloneState(Operator):
             issue_msg = f"Clone state issues detected: {', '.join(issues)}"
             self.report({'WARNING'}, issue_msg)
             print(f"CloneX: ⚠️  {issue_msg}")
-        
-        return {'FINISHED'}
 
 classes = (
     CT_OT_CloneSelectOperator,
@@ -2743,21 +3582,20 @@ classes = (
     CT_OT_FixScaleMismatch,
     CT_OT_AutoPositionTraits,
     CT_OT_ForceRegisterTraits,
+    CT_OT_RenameShapeKeys,
     CT_OT_EnhancedCloneImport,
     CT_OT_AnalyzeCloneState
 )
 
-def register():
-    for cls in classes:
-        register_class(cls)
+_register_classes, _unregister_classes = register_classes_factory(classes)
 
-    for al in bpy.context.preferences.filepaths.asset_libraries:
-        print('Checking library ' + al.name)
-        if al.name == 'CloneX Style Library':
-            print('Found CloneX Style Library')
-            bpy.context.window_manager.ctglobals.style_lib_initialized = True
+def register():
+    _dir_cache.clear()
+    _register_classes()
 
-            break
+    if ctutils.get_style_library_path():
+        print('Found CloneX Style Library')
+        bpy.context.window_manager.ctglobals.style_lib_initialized = True
 
     if hasattr(bpy.types, "UI_MT_list_item_context_menu"):
         bpy.types.UI_MT_list_item_context_menu.prepend(animation_menu_func)
@@ -2766,8 +3604,8 @@ def register():
     # bpy.app.handlers.depsgraph_update_post.append(wearable_equip_handler)   
 
 def unregister():
-    for cls in reversed(classes):
-        unregister_class(cls)
+    _dir_cache.clear()
+    _unregister_classes()
 
     if hasattr(bpy.types, "FILEBROWSER_HT_header"):
         bpy.types.FILEBROWSER_HT_header.remove(filter_style_gender_func)
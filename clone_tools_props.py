@@ -1,4 +1,5 @@
 import bpy, os
+import numpy as np
 
 from bpy.props import (
     StringProperty, 
@@ -10,7 +11,7 @@ from bpy.props import (
     PointerProperty
 )
 from bpy.types import Object, Collection, PropertyGroup, Scene, AddonPreferences
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 
 from . import addon_updater_ops
 from . import clone_tools_utils as ctutils
@@ -23,12 +24,12 @@ def asset_library_sync_handler(scene, depsgraph):
     if depsgraph is None:
         return
 
-    style_lib_path = ''
-    for al in bpy.context.preferences.filepaths.asset_libraries:
-        if al.name == 'CloneX Style Library':
-            style_lib_path = al.path
-            break
+    # Cheap C-side flag check so transform/frame/material updates bail out
+    # before the Python loop over depsgraph.updates
+    if not depsgraph.id_type_updated('COLLECTION'):
+        return
 
+    style_lib_path = ctutils.get_style_library_path()
     if not style_lib_path:
         return
 
@@ -112,6 +113,29 @@ class CharSheetShotPropertyGroup(PropertyGroup):
         max=3.0
     )
 
+def bulk_add_shots(coll, paths, includes=None, scales=None):
+    """Replace the shots in ``coll`` with one item per rendered image path.
+
+    Items are added up front and the numeric fields are written with a
+    single foreach_set each; only the string fields need a Python loop, as
+    RNA has no bulk setter for strings.
+    """
+    count = len(paths)
+    coll.clear()
+    for _ in range(count):
+        coll.add()
+
+    if includes is None:
+        includes = np.ones(count, dtype=bool)
+    if scales is None:
+        scales = np.ones(count, dtype=np.float32)
+    coll.foreach_set('include_in_sheet', np.asarray(includes, dtype=bool))
+    coll.foreach_set('scale', np.asarray(scales, dtype=np.float32))
+
+    for shot, path in zip(coll, paths):
+        shot.name = os.path.basename(path)
+        shot.file_path = path
+
 class ClonePropertyGroup(PropertyGroup):
     home_dir: StringProperty(default='', subtype='NONE')
     gender: EnumProperty(
@@ -157,6 +181,11 @@ class ClonePropertyGroup(PropertyGroup):
         description='Display detailed validation results after import',
         default=True
     )
+    autosave_after_pack_install: BoolProperty(
+        name='Save After Pack Install',
+        description='Save clonetools.blend in the clone folder after installing a content pack',
+        default=False
+    )
 
 class CloneToolsGlobalPropertyGroup(PropertyGroup):
     env_loaded: BoolProperty(default=False)
@@ -243,6 +272,21 @@ class CloneToolsGlobalPropertyGroup(PropertyGroup):
         min=1,
         max=12
     )
+    charsheet_fast_png: BoolProperty(
+        name='Fast PNG Compression',
+        description='Write character sheet views with light PNG compression (15%), trading file size for write time',
+        default=True
+    )
+    charsheet_render_processes: IntProperty(
+        name='Render Processes',
+        description=(
+            'Render views in this many background Blender processes, each pinned to one GPU '
+            'through CUDA_VISIBLE_DEVICES. 1 renders inside this session'
+        ),
+        default=1,
+        min=1,
+        max=16
+    )
     charsheet_shots: CollectionProperty(type=CharSheetShotPropertyGroup)
     charsheet_shot_index: IntProperty(default=0)
 
@@ -255,9 +299,10 @@ classes = (
     CloneToolsGlobalPropertyGroup
 )
 
+_register_classes, _unregister_classes = register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        register_class(cls)
+    _register_classes()
 
     Scene.clone_props = PointerProperty(type=ClonePropertyGroup)
     bpy.types.WindowManager.ctglobals = PointerProperty(type=CloneToolsGlobalPropertyGroup)
@@ -266,8 +311,7 @@ def register():
         bpy.app.handlers.depsgraph_update_post.append(asset_library_sync_handler)
     
 def unregister():
-    for cls in reversed(classes):
-        unregister_class(cls)
+    _unregister_classes()
 
     del bpy.types.WindowManager.ctglobals
     del Scene.clone_props
@@ -499,6 +499,8 @@ class CT_PT_RenderPanel(CT_BasePanel, Panel):
         box.prop(ctglobals, 'charsheet_build_page')
         if ctglobals.charsheet_build_page:
             box.prop(ctglobals, 'charsheet_page_columns')
+        box.prop(ctglobals, 'charsheet_fast_png')
+        box.prop(ctglobals, 'charsheet_render_processes')
 
         row = box.row()
         row.scale_y = 1.3
@@ -587,6 +589,7 @@ class CT_PT_PackPanel(CT_BasePanel, Panel):
             text='Load Content Pack',
             depress=True,
             emboss=True)
+        layout.prop(context.scene.clone_props, 'autosave_after_pack_install')
 
 class CT_PT_TroubleshootingPanel(CT_BasePanel, Panel):
     bl_label = 'Troubleshooting'
@@ -641,6 +644,12 @@ class CT_PT_TroubleshootingPanel(CT_BasePanel, Panel):
             text='Force Register Traits',
             icon='PRESET'
         )
+        
+        col.operator(
+            ctops.CT_OT_RenameShapeKeys.bl_idname,
+            text='Rename Shape Keys',
+            icon='SHAPEKEY_DATA'
+        )
 
         # Complete fixes operator
         box = layout.box()
@@ -679,6 +688,11 @@ class CT_PT_FileBrowserToolsPanel(Panel):
         layout.label(text='Right-click on items for equip options!')
 
 def style_library_list_item_context_menu(self: UIList, context: Context) -> None:
+    # Resolve the context asset once; the checks below all reuse it.
+    asset = get_context_asset(context)
+    if asset is None:
+        return
+
     def is_style_asset_view() -> bool:
         # Important: Must check context first, or the menu is added for every kind of list.
         list = getattr(context, "ui_list", None)
@@ -686,17 +700,9 @@ def style_library_list_item_context_menu(self: UIList, context: Context) -> None
         if not list or list.bl_idname != "UI_UL_asset_view" or list.list_id != "style_assets":
             return False
         
-        if not get_context_asset(context):
-            return False
-        
         return True
 
     def is_style_library_asset_browser() -> bool:
-        asset = get_context_asset(context)
-        
-        if not asset:
-            return False
-        
         asset_type = get_asset_id_type(asset)
         return bool(asset_type == 'COLLECTION' or asset_type == 'MATERIAL')
 
@@ -704,9 +710,6 @@ def style_library_list_item_context_menu(self: UIList, context: Context) -> None
         return
 
     layout = self.layout
-    asset = get_context_asset(context)
-    if asset is None:
-        return
 
     asset_name = get_asset_name(asset)
     asset_type = get_asset_id_type(asset)
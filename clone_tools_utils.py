@@ -1,5 +1,6 @@
-import bpy, addon_utils, os, shutil, time, re, json, zipfile, tempfile, hashlib
+import bpy, addon_utils, os, shutil, time, re, json, zipfile, tempfile, hashlib, pickle
 
+from functools import lru_cache
 from math import radians
 from mathutils import Matrix
 from pathlib import Path
@@ -14,6 +15,64 @@ _style_sync_in_progress = False
 _style_sync_pending = False
 _style_sync_path = ""
 _pose_action_cache = {}
+_pose_pack_blend_paths = {}
+
+def get_style_library_path():
+    """Return the CloneX Style Library path, or '' if it isn't registered."""
+    # A C-side name lookup; cheap enough for the depsgraph handler, and
+    # never stale when libraries are added or removed
+    al = bpy.context.preferences.filepaths.asset_libraries.get('CloneX Style Library')
+    return al.path if al is not None else ''
+
+@lru_cache(maxsize=1)
+def _load_trait_mapping():
+    """
+    Parse assets/catalog_trait_mapping.csv into {trait name: catalog id}.
+    Cached, so the file is only read the first time a trait is cataloged.
+    A pickled copy is kept next to the CSV and reused while it is newer.
+    """
+    assets_dir = Path(__file__).resolve().parent / 'assets'
+    mapping_file_path = assets_dir / 'catalog_trait_mapping.csv'
+    pickle_path = assets_dir / 'catalog_trait_mapping.pkl'
+
+    try:
+        if pickle_path.stat().st_mtime >= mapping_file_path.stat().st_mtime:
+            with open(pickle_path, 'rb') as data:
+                trait_catalog_dict = pickle.load(data)
+            if isinstance(trait_catalog_dict, dict):
+                return trait_catalog_dict
+    except Exception:
+        # Missing, stale or unreadable sidecar: fall back to the CSV
+        pass
+
+    text = mapping_file_path.read_text(encoding='utf-8')
+
+    # Plain two-column file with no quoting, so a partition per line is enough
+    trait_catalog_dict = {}
+    for line in text.splitlines():
+        if not line:
+            continue
+        name, _, catalog_id = line.partition(',')
+        trait_catalog_dict[name.lower()] = catalog_id.strip()
+
+    try:
+        with open(pickle_path, 'wb') as data:
+            pickle.dump(trait_catalog_dict, data, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        # Read-only addon installs simply skip the cache
+        print(f"CloneX: Could not write trait mapping cache: {e}")
+
+    return trait_catalog_dict
+
+def get_trait_mapping():
+    """
+    Return the trait catalog mapping, loading it on first use.
+    Also fills WindowManager.TRAIT_MAPPING for scripts that still read it.
+    """
+    trait_catalog_dict = _load_trait_mapping()
+    if getattr(bpy.types.WindowManager, "TRAIT_MAPPING", None) is None:
+        bpy.types.WindowManager.TRAIT_MAPPING = trait_catalog_dict
+    return trait_catalog_dict
 
 def get_content_packs_dir(context=None):
     """
@@ -283,11 +342,14 @@ def fix_shapekey_names():
             for key in ob.data.shape_keys.key_blocks:
                 # Do not change basis
                 if not key.name == "Basis":
+                    name = key.name
                     # Get last occurrence of any of these chars 
-                    n = max(key.name.rfind(i) for i in chars) + 1
+                    n = max(name.rfind(i) for i in chars) + 1
 
-                    # Slice all chars up to n 
-                    key.name = key.name[n:]
+                    # Slice all chars up to n; skip the write (and Blender's
+                    # unique-name check) when nothing would change
+                    if n:
+                        key.name = name[n:]
 
 def copy_shapekey_drivers(head_object):
     source = bpy.context.object
@@ -423,7 +485,11 @@ def _style_library_sync_timer_callback():
 
 
 def request_style_library_sync(library_path, delay=0.75):
-    """Queue a style-library sync on the main thread timer."""
+    """Queue a style-library sync on the main thread timer.
+
+    Repeated requests push the timer back, so a burst of edits (renaming,
+    dragging) settles into a single sync once things go quiet.
+    """
     global _style_sync_pending, _style_sync_path
 
     if not library_path:
@@ -432,11 +498,16 @@ def request_style_library_sync(library_path, delay=0.75):
     _style_sync_path = library_path
     _style_sync_pending = True
 
-    if not bpy.app.timers.is_registered(_style_library_sync_timer_callback):
-        bpy.app.timers.register(
-            _style_library_sync_timer_callback,
-            first_interval=max(0.1, delay)
-        )
+    # A sync already running reschedules itself via _style_sync_pending
+    if _style_sync_in_progress:
+        return True
+
+    if bpy.app.timers.is_registered(_style_library_sync_timer_callback):
+        bpy.app.timers.unregister(_style_library_sync_timer_callback)
+    bpy.app.timers.register(
+        _style_library_sync_timer_callback,
+        first_interval=max(0.1, delay)
+    )
 
     return True
 
@@ -741,8 +812,6 @@ def setup_staging_collection(context):
             hide_collection_render(scoll)
 
 def apply_facial_feature(filepath, trait_name):
-    wm = bpy.context.window_manager
-
     head_geos = get_objects_including('HeadGeo')
     head_mats = get_materials_containing('dna', head_geos[0])
 
@@ -786,7 +855,7 @@ def apply_facial_feature(filepath, trait_name):
             # Only auto-catalog assets that don't have a real UUID yet
             if ff_mat.asset_data.catalog_id == '00000000-0000-0000-0000-000000000000':
                 try:
-                    ff_mat.asset_data.catalog_id = wm.TRAIT_MAPPING[trait_name[3:].lower()]
+                    ff_mat.asset_data.catalog_id = get_trait_mapping()[trait_name[3:].lower()]
                 except:
                     print('No asset catalog mapping found for: ' + trait_name[3:].lower())
 
@@ -986,7 +1055,6 @@ def load_clone_trait_assets(trait_name, trait_dir, filepath, equip_now, auto_cat
                 coll.asset_generate_preview()
 
                 if auto_catalog:
-                    wm = bpy.context.window_manager
                     lookup_name = trait_name
 
                     if trait_name.startswith('f_') or trait_name.startswith('m_'):
@@ -999,7 +1067,7 @@ def load_clone_trait_assets(trait_name, trait_dir, filepath, equip_now, auto_cat
                     # Only auto-catalog assets that don't have a real UUID yet
                     if coll.asset_data.catalog_id == '00000000-0000-0000-0000-000000000000':
                         try:
-                            coll.asset_data.catalog_id = wm.TRAIT_MAPPING[lookup_name.lower()]
+                            coll.asset_data.catalog_id = get_trait_mapping()[lookup_name.lower()]
                         except:
                             # Try using the name of the trait directory
                             dir_name = Path(trait_dir).stem.lower()
@@ -1009,7 +1077,7 @@ def load_clone_trait_assets(trait_name, trait_dir, filepath, equip_now, auto_cat
                                 lookup_name = trait_name[(trait_name.find('-') + 1):]
 
                                 try:
-                                    coll.asset_data.catalog_id = wm.TRAIT_MAPPING[lookup_name.lower()]
+                                    coll.asset_data.catalog_id = get_trait_mapping()[lookup_name.lower()]
                                 except:  
                                     print('No asset catalog mapping found for: ' + lookup_name.lower())
 
@@ -1293,6 +1361,11 @@ def get_pose_pack_blend_path(context, selected_pack_name):
         return None
 
     cpdir = get_content_packs_dir(context)
+    cache_key = (str(cpdir), selected_pack_name)
+    cached = _pose_pack_blend_paths.get(cache_key)
+    if cached is not None and os.path.exists(cached):
+        return cached
+
     for pack_dir in _iter_pose_pack_dirs(cpdir):
         data = _read_packinfo(pack_dir)
         if data is None:
@@ -1302,10 +1375,15 @@ def get_pose_pack_blend_path(context, selected_pack_name):
 
         candidates = sorted(pack_dir.glob("*.blend"))
         if candidates:
+            _pose_pack_blend_paths[cache_key] = str(candidates[0])
             return str(candidates[0])
 
     return None
 
+def clear_pose_pack_caches():
+    """Forget resolved pose pack paths so the next lookup rescans the packs dir."""
+    _pose_pack_blend_paths.clear()
+
 def _get_actions_from_blend(blend_path):
     if not blend_path or not os.path.exists(blend_path):
         return []
@@ -1519,27 +1597,27 @@ def update_staging_options(self, context):
 def get_asset_catalog_names(self, context):
     catalog_names = []
 
-    for al in context.preferences.filepaths.asset_libraries:
-        if al.name == 'CloneX Style Library':
-            # Parse the blender_assets.cats.txt file to populate the list
-            # of valid asset catalog choices
-            style_lib_path = Path(al.path)
-
-            with (style_lib_path / 'blender_assets.cats.txt').open() as f:
-                for line in f.readlines():
-                    if line.startswith(("#", "VERSION", "\n")):
-                        continue
-
-                    # Each line contains : 'uuid:catalog_tree:catalog_name' + eol ('\n')
-                    # We want to find the simple catalog names and add them to the enum
-                    uuid = line.split(':')[0]
-                    tree = line.split(':')[1]
-                    name = line.split(':')[2].split('\n')[0]
-
-                    # Skip parent tree items and DNA/Facial Feature items 
-                    # since the custom import doesn't currently support textures
-                    if tree != name and (not 'DNA' in name) and (not 'Facial' in name):
-                        catalog_names.append((uuid, name, 'Style Library Category'))
+    style_lib_path = get_style_library_path()
+    if style_lib_path:
+        # Parse the blender_assets.cats.txt file to populate the list
+        # of valid asset catalog choices
+        style_lib_path = Path(style_lib_path)
+
+        with (style_lib_path / 'blender_assets.cats.txt').open() as f:
+            for line in f.readlines():
+                if line.startswith(("#", "VERSION", "\n")):
+                    continue
+
+                # Each line contains : 'uuid:catalog_tree:catalog_name' + eol ('\n')
+                # We want to find the simple catalog names and add them to the enum
+                uuid = line.split(':')[0]
+                tree = line.split(':')[1]
+                name = line.split(':')[2].split('\n')[0]
+
+                # Skip parent tree items and DNA/Facial Feature items 
+                # since the custom import doesn't currently support textures
+                if tree != name and (not 'DNA' in name) and (not 'Facial' in name):
+                    catalog_names.append((uuid, name, 'Style Library Category'))
 
     return catalog_names
     